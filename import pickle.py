@@ -1,90 +1,147 @@
 import pickle
 import os
-import requests
-import time
+import atexit
+import asyncio
+import aiohttp
 import json
 import threading
-import queue
 import random
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # 🚀 CACHE SYSTEM FOR AI MEMORY
 CACHE_FILE = "ai_memory_cache.pkl"
+CACHE_FLUSH_EVERY = 32  # Persist after this many new entries (and at exit)
+CACHE_IO_BUFFER = 1024 * 1024
 response_cache = {}
+_cache_dirty = 0
+_cache_lock = threading.Lock()
+
+# 🚀 HASHABLE CACHE KEYS (NO JSON SERIALIZATION ON THE LOOKUP PATH)
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _cache_key(endpoint, payload):
+    return (endpoint, _freeze(payload))
+
+# Older cache files used f"{endpoint}_{json.dumps(payload, sort_keys=True)}" keys
+def _upgrade_key(key):
+    if isinstance(key, str):
+        endpoint, _, payload_json = key.partition("_")
+        return _cache_key(endpoint, json.loads(payload_json))
+    return key
 
 # 🚀 LOAD MEMORY IF AVAILABLE
 if os.path.exists(CACHE_FILE):
-    with open(CACHE_FILE, "rb") as f:
-        response_cache = pickle.load(f)
+    with open(CACHE_FILE, "rb", buffering=CACHE_IO_BUFFER) as f:
+        response_cache = {_upgrade_key(k): v for k, v in pickle.load(f).items()}
 
 # 🚀 SYSTEM CONFIG: MAXIMUM INTELLIGENCE
 API_URL = "http://localhost:8000/api/v1/"
 HEADERS = {"Content-Type": "application/json"}
 MAX_RETRIES = 10
-RETRY_DELAY = 1  # Optimized adaptive delay
-MAX_WORKERS = 10  # AI-assisted concurrent threads
-task_queue = queue.Queue()
+RETRY_BASE_DELAY = 0.05  # Exponential backoff: 50 ms, 100 ms, 200 ms, ...
+RETRY_MAX_DELAY = 5.0
+RETRY_JITTER = 0.1  # Spread retries so concurrent tasks don't stampede the API
+MAX_WORKERS = 10  # Max concurrent in-flight requests (connection pool size)
+tasks = []
+
+# 🔥 ADAPTIVE RETRY DELAY (EXPONENTIAL BACKOFF + JITTER)
+def _retry_delay(attempt):
+    return min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY) + random.random() * RETRY_JITTER
 
 # 🔥 INTELLIGENT API REQUEST MANAGEMENT
-def make_request(endpoint, payload):
+async def make_request(session, endpoint, payload):
     url = API_URL + endpoint
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.post(url, headers=HEADERS, json=payload)
-            response.raise_for_status()
-            result = response.json()
+            async with session.post(url, json=payload) as response:
+                response.raise_for_status()
+                result = _json_loads(await response.read())
             if "choices" in result:
                 return result["choices"][0].get("text", result["choices"][0].get("message", {}).get("content", ""))
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientResponseError as e:
+            print(f"⚠️ API Error on attempt {attempt + 1}: {e}")
+            if 400 <= e.status < 500 and e.status != 429:
+                return f"❌ FAILED: CLIENT ERROR {e.status}"  # Retrying won't fix a bad request
+            await asyncio.sleep(_retry_delay(attempt))
+        except aiohttp.ClientConnectionError as e:
+            print(f"⚠️ API Error on attempt {attempt + 1}: {e}")
+            # A dropped pooled connection usually succeeds straight away on a fresh one
+            if attempt:
+                await asyncio.sleep(_retry_delay(attempt))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            # ValueError covers a body that isn't valid JSON (orjson/json decode errors)
             print(f"⚠️ API Error on attempt {attempt + 1}: {e}")
-            time.sleep(RETRY_DELAY)
+            await asyncio.sleep(_retry_delay(attempt))
     return "❌ FAILED: MAX RETRIES EXCEEDED"
 
 # 🚀 SMART AI REQUEST WITH MEMORY OPTIMIZATION
-def make_optimized_request(endpoint, payload):
-    cache_key = f"{endpoint}_{json.dumps(payload, sort_keys=True)}"
+async def make_optimized_request(session, endpoint, payload):
+    cache_key = _cache_key(endpoint, payload)
 
     # If cached response exists, use it instantly
     if cache_key in response_cache:
         print("🔁 USING CACHED RESPONSE")
         return response_cache[cache_key]
 
-    result = make_request(endpoint, payload)
+    result = await make_request(session, endpoint, payload)
 
-    # Store response in cache for optimization
-    response_cache[cache_key] = result
-    with open(CACHE_FILE, "wb") as f:
-        pickle.dump(response_cache, f)
+    # Store response in cache for optimization, flushing to disk in batches
+    global _cache_dirty
+    with _cache_lock:
+        response_cache[cache_key] = result
+        _cache_dirty += 1
+        should_flush = _cache_dirty >= CACHE_FLUSH_EVERY
+    if should_flush:
+        flush_cache()
 
     return result
 
+# 🚀 PERSIST MEMORY TO DISK (BATCHED)
+def flush_cache():
+    global _cache_dirty
+    with _cache_lock:
+        if not _cache_dirty:
+            return
+        with open(CACHE_FILE, "wb", buffering=CACHE_IO_BUFFER) as f:
+            pickle.dump(response_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _cache_dirty = 0
+
+atexit.register(flush_cache)
+
 # 🚀 AI SELF-REPAIRING EXECUTION SYSTEM
-def adaptive_api_request(endpoint, payload):
+async def adaptive_api_request(session, endpoint, payload):
     try:
-        response = make_request(endpoint, payload)
+        response = await make_request(session, endpoint, payload)
         if not response:
             print("⚠️ EMPTY RESPONSE! RETRYING WITH ADAPTIVE PARAMETERS...")
             payload["temperature"] = max(0.5, payload["temperature"] - 0.1)  # Adjust creativity
             payload["max_tokens"] = min(300, payload["max_tokens"] + 50)  # Expand response length
-            response = make_request(endpoint, payload)
+            response = await make_request(session, endpoint, payload)
         return response
     except Exception as e:
         print(f"🔥 CRITICAL ERROR: {e}")
         return "❌ AI REQUEST FAILED."
 
-# 🚀 ADVANCED MULTI-THREADED TASK MANAGEMENT
-def worker():
-    while True:
-        endpoint, payload = task_queue.get()
-        if endpoint is None:
-            break  # Termination signal
-        result = make_request(endpoint, payload)
-        print(f"✔️ COMPLETED: {endpoint}\n{result}\n")
-        task_queue.task_done()
-
-# 🚀 INSTANT PARALLEL WORKER ACTIVATION
-def start_workers(num_workers=MAX_WORKERS):
-    for _ in range(num_workers):
-        threading.Thread(target=worker, daemon=True).start()
+# 🚀 ADVANCED CONCURRENT TASK MANAGEMENT
+async def run_task(session, endpoint, payload):
+    result = await make_request(session, endpoint, payload)
+    print(f"✔️ COMPLETED: {endpoint}\n{result}\n")
+    return result
+
+# 🚀 INSTANT TASK SUBMISSION
+def submit_task(endpoint, payload):
+    tasks.append((endpoint, payload))
 
 # 🚀 INFINITY-OPTIMIZED AI-PROPELLED CODE GENERATION
 def complete_code(prompt, max_tokens=200, temperature=0.8):
@@ -93,7 +150,7 @@ def complete_code(prompt, max_tokens=200, temperature=0.8):
         "max_tokens": max_tokens,
         "temperature": temperature
     }
-    task_queue.put(("completion", payload))
+    submit_task("completion", payload)
 
 # 🚀 RECURSIVE CODE INSERTION LOGIC
 def insert_code(prefix, suffix, max_tokens=100):
@@ -102,7 +159,7 @@ def insert_code(prefix, suffix, max_tokens=100):
         "suffix": suffix,
         "max_tokens": max_tokens
     }
-    task_queue.put(("insertion", payload))
+    submit_task("insertion", payload)
 
 # 🚀 SUPER-INTELLIGENT AI-POWERED CHAT MEMORY SYSTEM
 def chat_ai(user_message, max_tokens=1000):
@@ -110,7 +167,7 @@ def chat_ai(user_message, max_tokens=1000):
         "messages": [{"role": "user", "content": user_message}],
         "max_tokens": max_tokens
     }
-    task_queue.put(("chat", payload))
+    submit_task("chat", payload)
 
 # 🚀 AUTO-GENERATION SYSTEM (SUSTAINED AI-ASSISTED TASK LOOPS)
 def auto_generate_tasks():
@@ -127,10 +184,14 @@ def auto_generate_tasks():
     insert_code("def AI_thought_process():", "    return neural_response")
     chat_ai("What is the most efficient sorting algorithm?")
 
-# 🚀 INITIALIZE HYPER-THREADED WORKERS
-start_workers()
+# 🚀 RUN ALL TASKS CONCURRENTLY ON ONE EVENT LOOP
+async def main():
+    connector = aiohttp.TCPConnector(limit=MAX_WORKERS)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        return await asyncio.gather(*(run_task(session, e, p) for e, p in tasks))
+
 auto_generate_tasks()
 
 # 🚀 WAIT FOR ALL TASKS TO FINISH
-task_queue.join()
+asyncio.run(main())
 print("🔥 INFINITY TASKS COMPLETED 🔥")
\ No newline at end of file
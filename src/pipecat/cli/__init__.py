@@ -4,62 +4,100 @@ Command-line interface for pipecat.
 This module provides command-line tools for working with pipecat applications
 including creating new projects, running examples, and managing resources.
 """
+from __future__ import annotations
 
 import argparse
 import sys
-from typing import List
 
-from .dashboard import dashboard_main
 
-
-def main(args: List[str] = None) -> int:
-    """Entry point for the pipecat CLI."""
-    if args is None:
-        args = sys.argv[1:]
-        
-    parser = argparse.ArgumentParser(description="Pipecat CLI")
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-    
-    # Create new project command
-    new_parser = subparsers.add_parser("new", help="Create a new pipecat project")
-    new_parser.add_argument("name", help="Name of the project")
-    new_parser.add_argument(
+def _run_new(args: list[str]) -> int:
+    """Handle ``pipecat new``."""
+    parser = argparse.ArgumentParser(prog="pipecat new", description=_COMMANDS["new"][0])
+    parser.add_argument("name", help="Name of the project")
+    parser.add_argument(
         "--template", 
         choices=["basic", "chatbot", "voice", "multimodal"], 
         default="basic",
         help="Template to use"
     )
+    parsed_args = parser.parse_args(args)
+    return create_new_project(parsed_args.name, parsed_args.template)
+
+
+def _run_example(args: list[str]) -> int:
+    """Handle ``pipecat example``."""
+    parser = argparse.ArgumentParser(prog="pipecat example", description=_COMMANDS["example"][0])
+    parser.add_argument("name", help="Name of the example to run")
+    parsed_args = parser.parse_args(args)
+    return run_example(parsed_args.name)
+
+
+def _run_dashboard(args: list[str]) -> int:
+    """Handle ``pipecat dashboard`` by handing the arguments to the dashboard CLI."""
+    from .dashboard import dashboard_main
     
-    # Run example command
-    example_parser = subparsers.add_parser("example", help="Run an example")
-    example_parser.add_argument("name", help="Name of the example to run")
+    return dashboard_main(args, prog="pipecat dashboard")
+
+
+# Command name -> (help text, handler that parses its own arguments)
+_COMMANDS = {
+    "new": ("Create a new pipecat project", _run_new),
+    "example": ("Run an example", _run_example),
+    "dashboard": ("Launch the Pipecat dashboard", _run_dashboard),
+}
+
+_CHOICES = "{" + ",".join(_COMMANDS) + "}"
+
+
+def _format_static_help() -> str:
+    """Render the top-level help text in argparse's layout, without argparse."""
+    lines = [
+        f"usage: pipecat [-h] {_CHOICES} ...",
+        "",
+        "Pipecat CLI",
+        "",
+        "positional arguments:",
+        f"  {_CHOICES}",
+        f"{'':24}Command to run",
+    ]
+    lines.extend(f"    {name:<20}{help_text}" for name, (help_text, _) in _COMMANDS.items())
+    lines.extend([
+        "",
+        # argparse renamed this section in Python 3.10
+        "options:" if sys.version_info >= (3, 10) else "optional arguments:",
+        "  -h, --help            show this help message and exit",
+        "",
+    ])
+    return "\n".join(lines)
+
+
+_STATIC_HELP = _format_static_help()
+
+
+def main(args: list[str] = None) -> int:
+    """Entry point for the pipecat CLI."""
+    if args is None:
+        args = sys.argv[1:]
     
-    # Dashboard command - just pass through to the dashboard module
-    dashboard_parser = subparsers.add_parser("dashboard", help="Launch the Pipecat dashboard")
-    dashboard_parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
-    dashboard_parser.add_argument("--port", type=int, default=8080, help="Port to bind to")
-    dashboard_parser.add_argument("--theme", choices=["light", "dark"], default="light", help="Dashboard theme")
+    # Top-level help needs no parser at all
+    if not args or args[0] in ("-h", "--help"):
+        sys.stdout.write(_STATIC_HELP)
+        return 0 if args else 1
     
-    # Parse args and dispatch
-    parsed_args = parser.parse_args(args)
+    # Dispatch on the command token; each command builds its own parser
+    command, rest = args[0], args[1:]
+    entry = _COMMANDS.get(command)
+    if entry is None:
+        choices = ", ".join(f"'{name}'" for name in _COMMANDS)
+        sys.stderr.write(
+            f"usage: pipecat [-h] {_CHOICES} ...\n"
+            f"pipecat: error: argument command: invalid choice: '{command}' "
+            f"(choose from {choices})\n"
+        )
+        return 2
     
-    if parsed_args.command == "new":
-        return create_new_project(parsed_args.name, parsed_args.template)
-    elif parsed_args.command == "example":
-        return run_example(parsed_args.name)
-    elif parsed_args.command == "dashboard":
-        # Extract dashboard args and pass to dashboard_main
-        dashboard_args = []
-        if parsed_args.host:
-            dashboard_args.extend(["--host", parsed_args.host])
-        if parsed_args.port:
-            dashboard_args.extend(["--port", str(parsed_args.port)])
-        if parsed_args.theme:
-            dashboard_args.extend(["--theme", parsed_args.theme])
-        return dashboard_main(dashboard_args)
-    else:
-        parser.print_help()
-        return 1
+    _, handler = entry
+    return handler(rest)
 
 
 def create_new_project(name: str, template: str) -> int:
@@ -1,22 +1,19 @@
 """
 Command-line interface for launching the Pipecat dashboard.
 """
+from __future__ import annotations
+
 import argparse
-import asyncio
 import sys
-import os
-from typing import List
-import uvicorn
-
-from ..web.dashboard import Dashboard, DashboardConfig
 
 
-def dashboard_main(args: List[str] = None) -> int:
+def dashboard_main(args: list[str] = None, prog: str = None) -> int:
     """
     Entry point for the pipecat dashboard CLI command.
     
     Args:
         args: Command-line arguments
+        prog: Program name shown in usage messages (defaults to argv[0])
         
     Returns:
         Exit code
@@ -24,7 +21,7 @@ def dashboard_main(args: List[str] = None) -> int:
     if args is None:
         args = sys.argv[1:]
     
-    parser = argparse.ArgumentParser(description="Pipecat Dashboard")
+    parser = argparse.ArgumentParser(prog=prog, description="Pipecat Dashboard")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8080, help="Port to bind to")
     parser.add_argument("--theme", choices=["light", "dark"], default="light", help="Dashboard theme")
@@ -37,6 +34,10 @@ def dashboard_main(args: List[str] = None) -> int:
     
     parsed_args = parser.parse_args(args)
     
+    # Deferred so that other CLI commands don't pay for FastAPI/uvicorn imports
+    import uvicorn
+    from ..web.dashboard import Dashboard, DashboardConfig
+    
     # Create dashboard configuration
     config = DashboardConfig(
         title=parsed_args.title,
@@ -5,9 +5,12 @@ This module handles loading, validation, and management of configuration setting
 for pipecat applications, including environment variables, defaults, and overrides.
 """
 
+import functools
 import os
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+_TRUTHY = frozenset(("true", "1", "yes"))
 
 
 @dataclass
@@ -20,19 +23,35 @@ class PipecatConfig:
     
     @classmethod
     def from_env(cls, prefix: str = "PIPECAT_") -> "PipecatConfig":
-        """Create a config instance from environment variables."""
-        config = cls()
+        """
+        Create a config instance from environment variables.
+        
+        The environment is read once per prefix; every call still returns a
+        new instance. Call ``_read_env.cache_clear()`` after changing the
+        environment (e.g. in tests) to pick up the new values.
+        """
+        return cls(**dict(_read_env(prefix)))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_env(prefix: str) -> Tuple[Tuple[str, Any], ...]:
+    """Config field overrides set in the environment, as hashable pairs."""
+    env = os.environ
+    overrides = []
+    
+    debug = env.get(prefix + "DEBUG")
+    if debug is not None:
+        overrides.append(("debug", debug.lower() in _TRUTHY))
+    
+    log_level = env.get(prefix + "LOG_LEVEL")
+    if log_level is not None:
+        overrides.append(("log_level", log_level))
         
-        if f"{prefix}DEBUG" in os.environ:
-            config.debug = os.environ[f"{prefix}DEBUG"].lower() in ("true", "1", "yes")
+    cache_dir = env.get(prefix + "CACHE_DIR")
+    if cache_dir is not None:
+        overrides.append(("cache_dir", cache_dir))
         
-        if f"{prefix}LOG_LEVEL" in os.environ:
-            config.log_level = os.environ[f"{prefix}LOG_LEVEL"]
-            
-        if f"{prefix}CACHE_DIR" in os.environ:
-            config.cache_dir = os.environ[f"{prefix}CACHE_DIR"]
-            
-        return config
+    return tuple(overrides)
 
 
 # Default config instance
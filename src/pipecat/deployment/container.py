@@ -2,9 +2,46 @@
 Container deployment utilities for Pipecat applications.
 """
 from dataclasses import dataclass, field
+import functools
 import os
+import re
 import subprocess
-from typing import List, Dict, Optional
+import sys
+from typing import List, Dict, Optional, Tuple
+
+from ..utils.files import write_atomic
+
+
+_DOCKERFILE_TEMPLATE = """\
+FROM {base_image}
+
+WORKDIR {working_dir}
+
+# Set environment variables
+ENV PYTHONDONTWRITEBYTECODE=1 \\
+    PYTHONUNBUFFERED=1 \\
+    PYTHONPATH={working_dir}{env_lines}{apt_block}
+
+# Copy project files
+COPY . {working_dir}/
+
+# Install dependencies
+RUN pip install --no-cache-dir -e ".{deps_target}"
+
+# Default command
+CMD ["python", "-m", "pipecat.cli"]"""
+
+_APT_BLOCK_TEMPLATE = """
+
+# Install system dependencies
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    {packages} \\
+    && apt-get clean \\
+    && rm -rf /var/lib/apt/lists/*"""
+
+
+# Timestamped per-step output lines from BuildKit's plain progress mode
+_BUILD_PROGRESS_RE = re.compile(r"^#\d+ \d+\.\d+ ")
 
 
 @dataclass
@@ -19,51 +56,39 @@ class DockerConfig:
     
     def to_dockerfile(self) -> str:
         """Generate a Dockerfile from this configuration."""
-        lines = [
-            f"FROM {self.base_image}",
-            "",
-            f"WORKDIR {self.working_dir}",
-            "",
-            "# Set environment variables",
-            "ENV PYTHONDONTWRITEBYTECODE=1 \\",
-            "    PYTHONUNBUFFERED=1 \\",
-            f"    PYTHONPATH={self.working_dir}"
-        ]
-        
-        # Add environment variables
-        for key, value in self.environment.items():
-            lines.append(f"ENV {key}={value}")
-        
-        # System dependencies
-        if self.extra_packages:
-            lines.extend([
-                "",
-                "# Install system dependencies",
-                "RUN apt-get update && apt-get install -y --no-install-recommends \\",
-                "    " + " \\\n    ".join(self.extra_packages) + " \\",
-                "    && apt-get clean \\",
-                "    && rm -rf /var/lib/apt/lists/*"
-            ])
-        
-        # Project files
-        lines.extend([
-            "",
-            "# Copy project files",
-            f"COPY . {self.working_dir}/",
-            ""
-        ])
-        
-        # Dependencies
-        deps_target = "[all]" if self.install_dev_deps else ""
-        lines.extend([
-            "# Install dependencies",
-            f'RUN pip install --no-cache-dir -e ".{deps_target}"',
-            "",
-            "# Default command",
-            'CMD ["python", "-m", "pipecat.cli"]'
-        ])
-        
-        return "\n".join(lines)
+        return _render_dockerfile(
+            self.base_image,
+            self.working_dir,
+            self.install_dev_deps,
+            tuple(self.extra_packages),
+            tuple(self.environment.items()),
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _render_dockerfile(base_image: str,
+                       working_dir: str,
+                       install_dev_deps: bool,
+                       extra_packages: Tuple[str, ...],
+                       environment: Tuple[Tuple[str, str], ...]) -> str:
+    """Render a Dockerfile, memoized on a hashable snapshot of a ``DockerConfig``."""
+    env_lines = "".join(
+        f"\nENV {key}={value}" for key, value in environment
+    )
+    
+    apt_block = ""
+    if extra_packages:
+        apt_block = _APT_BLOCK_TEMPLATE.format(
+            packages=" \\\n    ".join(extra_packages)
+        )
+    
+    return _DOCKERFILE_TEMPLATE.format(
+        base_image=base_image,
+        working_dir=working_dir,
+        env_lines=env_lines,
+        apt_block=apt_block,
+        deps_target="[all]" if install_dev_deps else "",
+    )
 
 
 class DockerBuilder:
@@ -73,17 +98,33 @@ class DockerBuilder:
         self.config = config or DockerConfig()
     
     def generate_dockerfile(self, output_path: str) -> None:
-        """Generate a Dockerfile at the specified path."""
-        dockerfile_content = self.config.to_dockerfile()
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(dockerfile_content)
+        """Generate a Dockerfile at the specified path.
+
+        An existing file with identical content is left untouched so its
+        mtime doesn't change and build tooling watching it isn't invalidated.
+        Otherwise the file is replaced atomically, so readers never observe a
+        partially written Dockerfile.
+        """
+        dockerfile_content = self.config.to_dockerfile().encode("utf-8")
+        try:
+            with open(output_path, "rb") as f:
+                if f.read() == dockerfile_content:
+                    return
+        except FileNotFoundError:
+            pass
+
+        parent = os.path.dirname(output_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        
+        write_atomic(output_path, dockerfile_content)
     
     def build_image(self, 
                     tag: str, 
                     context_path: str = ".", 
-                    dockerfile_path: Optional[str] = None) -> bool:
-        """Build a Docker image."""
+                    dockerfile_path: Optional[str] = None,
+                    quiet: bool = False) -> bool:
+        """Build a Docker image (``quiet`` hides BuildKit's per-step progress lines)."""
         cmd = ["docker", "build", "-t", tag]
         
         if dockerfile_path:
@@ -91,9 +132,26 @@ class DockerBuilder:
         
         cmd.append(context_path)
         
-        try:
-            subprocess.run(cmd, check=True)
-            return True
-        except subprocess.CalledProcessError as e:
+        if not quiet:
+            # Let docker write to the terminal directly, keeping its TTY output
+            returncode = subprocess.run(cmd).returncode
+        else:
+            # BuildKit reports progress on stderr, so filter both streams
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                bufsize=1
+            ) as proc:
+                for line in proc.stdout:
+                    if not _BUILD_PROGRESS_RE.match(line):
+                        sys.stdout.write(line)
+            returncode = proc.returncode
+        
+        if returncode != 0:
+            e = subprocess.CalledProcessError(returncode, cmd)
             print(f"Error building Docker image: {e}")
             return False
+        return True
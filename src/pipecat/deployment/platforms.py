@@ -1,13 +1,22 @@
 """
 Platform-specific deployment utilities for Pipecat applications.
 """
+import functools
+import json
 import os
+import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str:
+    """Resolve an executable on PATH once, falling back to the bare name."""
+    return shutil.which(name) or name
+
+
 class Deployer(ABC):
     """Base class for platform-specific deployers."""
     
@@ -27,6 +36,7 @@ class FlyIODeployer(Deployer):
     
     def __init__(self, api_token: Optional[str] = None):
         self.api_token = api_token or os.environ.get("FLY_API_TOKEN")
+        self._fly = _which("fly")
     
     def deploy(self, app_path: str, **kwargs) -> bool:
         """Deploy the application to Fly.io."""
@@ -39,7 +49,7 @@ class FlyIODeployer(Deployer):
             env_args.extend(["--env", f"{key}={value}"])
         
         cmd = [
-            "fly", "launch",
+            self._fly, "launch",
             "--name", app_name,
             "--region", region
         ] + env_args
@@ -55,15 +65,16 @@ class FlyIODeployer(Deployer):
         """Get the status of a deployed application on Fly.io."""
         try:
             result = subprocess.run(
-                ["fly", "status", "-a", app_name],
+                [self._fly, "status", "-a", app_name, "--json"],
                 check=True,
                 capture_output=True,
-                text=True
+                stdin=subprocess.DEVNULL
             )
-            # Parse the output to extract status information
-            status = {"status": "running" if "is running" in result.stdout else "stopped"}
-            return status
-        except subprocess.CalledProcessError as e:
+            # Parse the machine list rather than scanning human-readable output
+            machines = json.loads(result.stdout).get("Machines") or []
+            running = any(m.get("state") == "started" for m in machines)
+            return {"status": "running" if running else "stopped"}
+        except (subprocess.CalledProcessError, ValueError) as e:
             print(f"Error getting status from Fly.io: {e}")
             return {"status": "unknown", "error": str(e)}
 
@@ -71,12 +82,15 @@ class FlyIODeployer(Deployer):
 class ModalDeployer(Deployer):
     """Deployer for Modal platform."""
     
+    def __init__(self):
+        self._modal = _which("modal")
+    
     def deploy(self, app_path: str, **kwargs) -> bool:
         """Deploy the application to Modal."""
         # Modal-specific deployment logic
         try:
             subprocess.run(
-                ["modal", "deploy", app_path],
+                [self._modal, "deploy", app_path],
                 check=True
             )
             return True
@@ -88,20 +102,28 @@ class ModalDeployer(Deployer):
         """Get the status of a deployed application on Modal."""
         try:
             result = subprocess.run(
-                ["modal", "app", "show", app_name],
+                [self._modal, "app", "list", "--json"],
                 check=True,
                 capture_output=True,
-                text=True
+                stdin=subprocess.DEVNULL
             )
-            # Parse the output to extract status information
-            return {"status": "running" if "running" in result.stdout else "stopped"}
-        except subprocess.CalledProcessError as e:
+            # Find the app by name and check it hasn't been stopped
+            running = any(
+                app.get("Description") == app_name and app.get("State") != "stopped"
+                for app in json.loads(result.stdout)
+            )
+            return {"status": "running" if running else "stopped"}
+        except (subprocess.CalledProcessError, ValueError) as e:
             return {"status": "unknown", "error": str(e)}
 
 
 class HerokuDeployer(Deployer):
     """Deployer for Heroku platform."""
     
+    def __init__(self):
+        self._heroku = _which("heroku")
+        self._git = _which("git")
+    
     def deploy(self, app_path: str, **kwargs) -> bool:
         """Deploy the application to Heroku."""
         app_name = kwargs.get("app_name")
@@ -110,39 +132,41 @@ class HerokuDeployer(Deployer):
             # Initialize Git if not already initialized
             git_dir = Path(app_path) / ".git"
             if not git_dir.exists():
-                subprocess.run(["git", "init"], cwd=app_path, check=True)
+                subprocess.run([self._git, "init"], cwd=app_path, check=True)
             
             # Create Heroku app if it doesn't exist
             try:
                 subprocess.run(
-                    ["heroku", "apps:info", app_name],
+                    [self._heroku, "apps:info", app_name],
                     check=True, 
                     stdout=subprocess.DEVNULL
                 )
             except subprocess.CalledProcessError:
                 subprocess.run(
-                    ["heroku", "create", app_name],
+                    [self._heroku, "create", app_name],
                     check=True,
                     cwd=app_path
                 )
             
-            # Set environment variables
+            # Set all environment variables in a single config:set call
             env_vars = kwargs.get("env_vars", {})
-            for key, value in env_vars.items():
+            if env_vars:
                 subprocess.run(
-                    ["heroku", "config:set", f"{key}={value}", "-a", app_name],
+                    [self._heroku, "config:set"]
+                    + [f"{key}={value}" for key, value in env_vars.items()]
+                    + ["-a", app_name],
                     check=True
                 )
             
             # Deploy to Heroku
             subprocess.run(
-                ["git", "add", "."],
+                [self._git, "add", "."],
                 cwd=app_path,
                 check=True
             )
             try:
                 subprocess.run(
-                    ["git", "commit", "-m", "Deploy to Heroku"],
+                    [self._git, "commit", "-m", "Deploy to Heroku"],
                     cwd=app_path,
                     check=True
                 )
@@ -151,7 +175,7 @@ class HerokuDeployer(Deployer):
                 pass
             
             subprocess.run(
-                ["git", "push", "heroku", "main"],
+                [self._git, "push", "heroku", "main"],
                 cwd=app_path,
                 check=True
             )
@@ -165,11 +189,13 @@ class HerokuDeployer(Deployer):
         """Get the status of a deployed application on Heroku."""
         try:
             result = subprocess.run(
-                ["heroku", "ps", "-a", app_name],
+                [self._heroku, "ps", "-a", app_name, "--json"],
                 check=True,
                 capture_output=True,
-                text=True
+                stdin=subprocess.DEVNULL
             )
-            return {"status": "running" if "up" in result.stdout else "stopped"}
-        except subprocess.CalledProcessError as e:
+            dynos = json.loads(result.stdout)
+            running = any(dyno.get("state") == "up" for dyno in dynos)
+            return {"status": "running" if running else "stopped"}
+        except (subprocess.CalledProcessError, ValueError) as e:
             return {"status": "unknown", "error": str(e)}
@@ -1,13 +1,18 @@
 """
 Metrics collection and reporting for Pipecat applications.
 """
+import contextlib
+import os
 import time
+from array import array
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Union, Callable
 import threading
 import json
-import statistics
+import weakref
+
+import numpy as np
 
 
 class MetricType(Enum):
@@ -19,6 +24,26 @@ class MetricType(Enum):
     TIMER = auto()
 
 
+def _shard_count(default: int = 16) -> int:
+    """Read the lock stripe count from ``PIPECAT_METRICS_SHARDS``.
+
+    Falls back to ``default`` when the variable is unset or not an integer,
+    and rounds up to a power of two so a mask picks the stripe.
+    """
+    try:
+        count = int(os.environ.get("PIPECAT_METRICS_SHARDS", default))
+    except ValueError:
+        count = default
+    return 1 << max(0, count - 1).bit_length()
+
+
+# Number of lock stripes
+_SHARD_COUNT = _shard_count()
+
+# Samples a thread buffers locally before merging them into the shards
+_FLUSH_THRESHOLD = 256
+
+
 @dataclass
 class Metric:
     """A single metric measurement."""
@@ -30,47 +55,210 @@ class Metric:
     timestamp: float = field(default_factory=time.time)
 
 
+class _Series:
+    """Samples of one metric stored column-wise in flat arrays."""
+    
+    __slots__ = ("type", "values", "timestamps", "tag_ids")
+    
+    def __init__(self, metric_type: MetricType):
+        self.type = metric_type
+        self.values = array("d")
+        self.timestamps = array("d")
+        self.tag_ids = array("I")
+    
+    def copy(self) -> "_Series":
+        series = _Series(self.type)
+        series.values = array("d", self.values)
+        series.timestamps = array("d", self.timestamps)
+        series.tag_ids = array("I", self.tag_ids)
+        return series
+    
+    def latest_index(self) -> int:
+        """Index of the newest sample, preferring the later one on ties."""
+        timestamps = np.frombuffer(self.timestamps, dtype=np.float64)
+        return len(timestamps) - 1 - int(np.argmax(timestamps[::-1]))
+    
+    def to_metrics(self, name: str, tag_table: List[Dict[str, str]]) -> List[Metric]:
+        return [
+            Metric(name, value, self.type, dict(tag_table[tag_id]), timestamp)
+            for value, timestamp, tag_id in zip(self.values, self.timestamps, self.tag_ids)
+        ]
+
+
+class _SampleBuffer:
+    """Samples recorded by one thread that haven't been merged into the shards yet."""
+    
+    __slots__ = ("items", "lock", "thread")
+    
+    def __init__(self):
+        # (name, type, value, tags, timestamp) tuples
+        self.items: List[tuple] = []
+        # Only the owning thread appends; the lock serializes draining
+        self.lock = threading.Lock()
+        self.thread = weakref.ref(threading.current_thread())
+
+
 class MetricsCollector:
     """Collects and reports metrics for Pipecat applications."""
     
     def __init__(self):
-        self.metrics: Dict[str, List[Metric]] = {}
-        self._lock = threading.Lock()
+        # Metrics are striped across shards by name, each guarded by its own
+        # lock, so threads recording different metrics rarely contend.
+        self._shards: List[Dict[str, _Series]] = [{} for _ in range(_SHARD_COUNT)]
+        # Counters are aggregated in place as [total, latest, timestamp, tags]
+        # cells rather than keeping every increment.
+        self._counters: List[Dict[str, list]] = [{} for _ in range(_SHARD_COUNT)]
+        self._locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        self._shard_mask = _SHARD_COUNT - 1
+        # Sample tag dicts interned to ids; id 0 is always the empty tag set.
+        # reset() replaces both, so ids never outlive the samples using them.
+        self._tag_table: List[Dict[str, str]] = [{}]
+        self._tag_ids: Dict[tuple, int] = {(): 0}
+        self._tag_lock = threading.Lock()
+        # Per-thread sample buffers, plus a registry so readers can drain them all
+        self._tls = threading.local()
+        self._buffers: List[_SampleBuffer] = []
+        self._buffers_lock = threading.Lock()
         self.reporters: List[Callable[[Dict[str, List[Metric]]], None]] = []
     
+    @property
+    def metrics(self) -> Dict[str, List[Metric]]:
+        """Snapshot of all collected metrics, keyed by name.
+
+        Each counter appears as a single metric carrying its running total.
+        """
+        series, counters, tag_table = self._snapshot()
+        metrics = {name: s.to_metrics(name, tag_table) for name, s in series.items()}
+        for name, (total, _, timestamp, tags) in counters.items():
+            metrics[name] = [Metric(name, total, MetricType.COUNTER, dict(tags), timestamp)]
+        return metrics
+    
+    @contextlib.contextmanager
+    def _all_shards_locked(self):
+        """Hold every stripe lock, always acquired in the same order."""
+        with contextlib.ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            yield
+    
+    def _snapshot(self):
+        """Copy sample series, counter cells and the tag table they refer to."""
+        self.flush()
+        series = {}
+        counters = {}
+        # All at once, so a concurrent reset() can't pair samples with the
+        # wrong tag table
+        with self._all_shards_locked():
+            for shard, cells in zip(self._shards, self._counters):
+                series.update((k, v.copy()) for k, v in shard.items())
+                counters.update((k, tuple(v)) for k, v in cells.items())
+            tag_table = self._tag_table
+        return series, counters, tag_table
+    
     def record(self, metric: Metric) -> None:
         """Record a new metric."""
-        with self._lock:
-            if metric.name not in self.metrics:
-                self.metrics[metric.name] = []
-            self.metrics[metric.name].append(metric)
+        if metric.type is MetricType.COUNTER:
+            self._count(metric.name, metric.value, metric.tags, metric.timestamp)
+        else:
+            self._sample(metric.name, metric.type, metric.value, metric.tags, metric.timestamp)
+    
+    def _sample(self, name: str, metric_type: MetricType, value: float,
+                tags: Optional[Dict[str, str]], timestamp: float) -> None:
+        # Convert now, so a bad value fails in the caller that recorded it
+        # rather than later in whichever thread drains the buffer
+        value = float(value)
+        timestamp = float(timestamp)
+        buf = getattr(self._tls, "buf", None)
+        if buf is None:
+            buf = self._tls.buf = _SampleBuffer()
+            with self._buffers_lock:
+                self._buffers.append(buf)
+        buf.items.append((name, metric_type, value, tags, timestamp))
+        if len(buf.items) >= _FLUSH_THRESHOLD:
+            self._drain(buf)
+    
+    def flush(self) -> None:
+        """Merge samples buffered by every thread into the shared store."""
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        for buf in buffers:
+            # Check before draining: once the owner has exited nothing more
+            # can be appended, so this drain empties the buffer for good
+            thread = buf.thread()
+            exited = thread is None or not thread.is_alive()
+            self._drain(buf)
+            if exited:
+                with self._buffers_lock:
+                    # A concurrent flush may have dropped it already
+                    if buf in self._buffers:
+                        self._buffers.remove(buf)
+    
+    def _drain(self, buf: _SampleBuffer, discard: bool = False) -> None:
+        with buf.lock:
+            pending = buf.items[:]
+            # Anything the owner appends meanwhile lands after these and is kept
+            del buf.items[:len(pending)]
+        if discard:
+            return
+        
+        by_shard: Dict[int, List[tuple]] = {}
+        for item in pending:
+            by_shard.setdefault(hash(item[0]) & self._shard_mask, []).append(item)
+        intern_tags = self._intern_tags
+        for idx, items in by_shard.items():
+            shard = self._shards[idx]
+            with self._locks[idx]:
+                for name, metric_type, value, tags, timestamp in items:
+                    series = shard.get(name)
+                    if series is None:
+                        series = shard[name] = _Series(metric_type)
+                    series.values.append(value)
+                    series.timestamps.append(timestamp)
+                    series.tag_ids.append(intern_tags(tags))
+    
+    def _intern_tags(self, tags: Optional[Dict[str, str]]) -> int:
+        """Return the id for a tag set, assigning one if it's new.
+
+        Called with a stripe lock held, so reset() can't swap the table meanwhile.
+        """
+        if not tags:
+            return 0
+        key = tuple(sorted(tags.items()))
+        tag_id = self._tag_ids.get(key)
+        if tag_id is None:
+            with self._tag_lock:
+                tag_id = self._tag_ids.get(key)
+                if tag_id is None:
+                    tag_id = len(self._tag_table)
+                    self._tag_table.append(dict(tags))
+                    self._tag_ids[key] = tag_id
+        return tag_id
+    
+    def _count(self, name: str, increment: int, tags: Dict[str, str], timestamp: float) -> None:
+        idx = hash(name) & self._shard_mask
+        cells = self._counters[idx]
+        # The update is a read-modify-write, so it stays under the stripe lock
+        with self._locks[idx]:
+            cell = cells.get(name)
+            if cell is None:
+                cells[name] = [increment, increment, timestamp, tags]
+            else:
+                cell[0] += increment
+                cell[1] = increment
+                cell[2] = timestamp
+                cell[3] = tags
     
     def counter(self, name: str, increment: int = 1, tags: Optional[Dict[str, str]] = None) -> None:
         """Increment a counter metric."""
-        self.record(Metric(
-            name=name,
-            value=increment,
-            type=MetricType.COUNTER,
-            tags=tags or {}
-        ))
+        self._count(name, increment, tags or {}, time.time())
     
     def gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """Record a gauge metric."""
-        self.record(Metric(
-            name=name,
-            value=value,
-            type=MetricType.GAUGE,
-            tags=tags or {}
-        ))
+        self._sample(name, MetricType.GAUGE, value, tags, time.time())
     
     def histogram(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """Record a histogram metric."""
-        self.record(Metric(
-            name=name,
-            value=value,
-            type=MetricType.HISTOGRAM,
-            tags=tags or {}
-        ))
+        self._sample(name, MetricType.HISTOGRAM, value, tags, time.time())
     
     def timer(self) -> 'Timer':
         """Create a timer for measuring execution time."""
@@ -82,8 +270,7 @@ class MetricsCollector:
     
     def report(self) -> None:
         """Report all collected metrics using registered reporters."""
-        with self._lock:
-            metrics_copy = {k: list(v) for k, v in self.metrics.items()}
+        metrics_copy = self.metrics
         
         for reporter in self.reporters:
             try:
@@ -93,39 +280,53 @@ class MetricsCollector:
     
     def get_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all collected metrics."""
+        series, counters, _ = self._snapshot()
         stats = {}
-        with self._lock:
-            for name, metrics in self.metrics.items():
-                if not metrics:
-                    continue
-                
-                metric_type = metrics[0].type
-                values = [m.value for m in metrics]
-                
-                if metric_type == MetricType.COUNTER:
-                    stats[name] = {"total": sum(values)}
-                elif metric_type in (MetricType.GAUGE, MetricType.HISTOGRAM):
-                    stats[name] = {
-                        "min": min(values),
-                        "max": max(values),
-                        "mean": statistics.mean(values),
-                        "median": statistics.median(values),
-                        "count": len(values)
-                    }
-                    if len(values) > 1:
-                        stats[name]["stddev"] = statistics.stdev(values)
-                
-                # Add latest value and timestamp
-                latest = metrics[-1]
-                stats[name]["latest"] = latest.value
-                stats[name]["last_updated"] = latest.timestamp
+        for name, (total, latest, timestamp, _) in counters.items():
+            stats[name] = {"total": total, "latest": latest, "last_updated": timestamp}
+        
+        for name, samples in series.items():
+            if not samples.values:
+                continue
+            
+            # Zero-copy view of the column, so each statistic is one C-level pass
+            values = np.frombuffer(samples.values, dtype=np.float64)
+            stats[name] = {
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "mean": float(values.mean()),
+                "median": float(np.median(values)),
+                "count": int(values.size)
+            }
+            if samples.type in (MetricType.HISTOGRAM, MetricType.TIMER):
+                p90, p99 = np.quantile(values, (0.9, 0.99))
+                stats[name]["p90"] = float(p90)
+                stats[name]["p99"] = float(p99)
+            if values.size > 1:
+                stats[name]["stddev"] = float(values.std(ddof=1))
+            
+            # Add latest value and timestamp; threads flush out of order, so
+            # the newest sample isn't necessarily the last one appended
+            i = samples.latest_index()
+            stats[name]["latest"] = samples.values[i]
+            stats[name]["last_updated"] = samples.timestamps[i]
         
         return stats
     
     def reset(self) -> None:
         """Reset all collected metrics."""
-        with self._lock:
-            self.metrics.clear()
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        for buf in buffers:
+            self._drain(buf, discard=True)
+        with self._all_shards_locked():
+            for shard, cells in zip(self._shards, self._counters):
+                shard.clear()
+                cells.clear()
+            # Snapshots already taken keep the old table, so replace it
+            # rather than clearing it in place
+            self._tag_table = [{}]
+            self._tag_ids = {(): 0}
 
 
 class Timer:
@@ -155,6 +356,21 @@ class Timer:
 # Create a default metrics collector instance
 default_collector = MetricsCollector()
 
+def _summarize(metric_list: List[Metric]):
+    """Return (min, max, mean, count) of the values in one pass."""
+    lo = hi = metric_list[0].value
+    total = 0.0
+    for m in metric_list:
+        v = m.value
+        total += v
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    count = len(metric_list)
+    return lo, hi, total / count, count
+
+
 # Add a simple console reporter
 def console_reporter(metrics: Dict[str, List[Metric]]) -> None:
     """Report metrics to the console in a readable format."""
@@ -164,31 +380,32 @@ def console_reporter(metrics: Dict[str, List[Metric]]) -> None:
             continue
             
         metric_type = metric_list[0].type
-        values = [m.value for m in metric_list]
         
         if metric_type == MetricType.COUNTER:
-            summary[name] = {"type": "counter", "total": sum(values)}
+            summary[name] = {"type": "counter", "total": sum(m.value for m in metric_list)}
         elif metric_type == MetricType.GAUGE:
             summary[name] = {
                 "type": "gauge", 
                 "latest": metric_list[-1].value,
-                "count": len(values)
+                "count": len(metric_list)
             }
         elif metric_type == MetricType.HISTOGRAM:
+            lo, hi, mean, count = _summarize(metric_list)
             summary[name] = {
                 "type": "histogram",
-                "min": min(values),
-                "max": max(values),
-                "mean": statistics.mean(values),
-                "count": len(values)
+                "min": lo,
+                "max": hi,
+                "mean": mean,
+                "count": count
             }
         elif metric_type == MetricType.TIMER:
+            lo, hi, mean, count = _summarize(metric_list)
             summary[name] = {
                 "type": "timer",
-                "min_ms": min(values),
-                "max_ms": max(values),
-                "mean_ms": statistics.mean(values),
-                "count": len(values)
+                "min_ms": lo,
+                "max_ms": hi,
+                "mean_ms": mean,
+                "count": count
             }
     
     print("\n=== Metrics Summary ===")
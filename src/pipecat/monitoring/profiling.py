@@ -25,14 +25,14 @@ class Profiler:
         
     def __enter__(self):
         if self.enabled:
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             self.profiler.enable()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.enabled:
             self.profiler.disable()
-            self.duration = time.time() - self.start_time
+            self.duration = time.perf_counter() - self.start_time
     
     def print_stats(self, 
                    sort_by: str = "cumulative", 
@@ -118,10 +118,9 @@ def profile_block(name: str = "code_block",
         Profiler instance
     """
     profiler = Profiler(name=name, enabled=enabled)
-    profiler.__enter__()
     try:
-        yield profiler
+        with profiler:
+            yield profiler
     finally:
-        profiler.__exit__(None, None, None)
         if enabled:
             profiler.print_stats(sort_by=sort_by, limit=limit)
@@ -7,14 +7,11 @@ better performance, lower latency, and more efficient resource usage.
 
 from .caching import ResultCache, MemoryCache, PersistentCache
 from .batching import BatchProcessor, DynamicBatcher
-from .parallel import ParallelExecutor, TaskPool
 
 __all__ = [
     "ResultCache", 
     "MemoryCache", 
     "PersistentCache",
     "BatchProcessor",
-    "DynamicBatcher",
-    "ParallelExecutor",
-    "TaskPool"
+    "DynamicBatcher"
 ]
@@ -27,7 +27,8 @@ class BatchProcessor(Generic[T, U]):
         self,
         process_fn: Callable[[List[T]], List[U]],
         max_batch_size: int = 32,
-        max_wait_time: float = 0.1
+        max_wait_time: float = 0.1,
+        run_in_thread: bool = True
     ):
         """
         Initialize the batch processor.
@@ -36,15 +37,20 @@ class BatchProcessor(Generic[T, U]):
             process_fn: Function that processes a batch of items
             max_batch_size: Maximum number of items in a batch
             max_wait_time: Maximum time to wait for a batch to fill up (seconds)
+            run_in_thread: Whether to run process_fn in a worker thread; pass
+                False for cheap functions to call them inline on the event loop
         """
         self.process_fn = process_fn
         self.max_batch_size = max_batch_size
         self.max_wait_time = max_wait_time
+        self.run_in_thread = run_in_thread
         
-        self._current_batch: List[T] = []
-        self._batch_lock = asyncio.Lock()
+        # Items of the batch being filled, and the one future they all await.
+        # Only touched between awaits on the event loop thread, so producers
+        # and the processing loop never need a lock to share them.
+        self._current_items: List[T] = []
+        self._batch_future: Optional[asyncio.Future] = None
         self._batch_event = asyncio.Event()
-        self._last_item_time = time.time()
         self._processing = False
         self._task: Optional[asyncio.Task] = None
     
@@ -66,6 +72,13 @@ class BatchProcessor(Generic[T, U]):
             self._batch_event.set()  # Wake up the processing loop
             await self._task
             self._task = None
+        
+        # Items that never made it into a batch won't be processed; don't
+        # leave their callers waiting forever
+        if self._batch_future is not None:
+            self._batch_future.cancel()
+        self._current_items = []
+        self._batch_future = None
     
     async def process(self, item: T) -> U:
         """
@@ -77,20 +90,22 @@ class BatchProcessor(Generic[T, U]):
         Returns:
             Processed result
         """
-        # Create a future to hold the result
-        future = asyncio.Future()
+        # Add the item to the current batch, remembering its position
+        if self._batch_future is None:
+            self._batch_future = asyncio.get_running_loop().create_future()
+        future = self._batch_future
+        index = len(self._current_items)
+        self._current_items.append(item)
         
-        # Add the item and its future to the current batch
-        async with self._batch_lock:
-            self._current_batch.append((item, future))
-            self._last_item_time = time.time()
-            
-            # If the batch is full, notify the processing loop
-            if len(self._current_batch) >= self.max_batch_size:
-                self._batch_event.set()
+        # If the batch is full, notify the processing loop
+        if len(self._current_items) >= self.max_batch_size:
+            self._batch_event.set()
         
-        # Wait for the result
-        return await future
+        # Wait for the whole batch and pick out this item's result. The future
+        # is shared by every caller in the batch, so shield it: cancelling
+        # one caller must not cancel the batch for the others.
+        results = await asyncio.shield(future)
+        return results[index]
     
     async def _process_loop(self):
         """Main processing loop for batches."""
@@ -101,47 +116,34 @@ class BatchProcessor(Generic[T, U]):
             if not self._processing:
                 break
             
-            # Get the current batch
-            async with self._batch_lock:
-                if not self._current_batch:
-                    continue
-                
-                batch_to_process = self._current_batch
-                self._current_batch = []
-                self._batch_event.clear()
+            # Take the current batch
+            if not self._current_items:
+                continue
             
-            # Process the batch
+            items = self._current_items
+            future = self._batch_future
+            self._current_items = []
+            self._batch_future = None
+            self._batch_event.clear()
+            
+            # Process the batch and complete every caller at once
             try:
-                items, futures = zip(*batch_to_process)
-                results = await asyncio.to_thread(self.process_fn, list(items))
-                
-                # Set results for futures
-                for future, result in zip(futures, results):
-                    future.set_result(result)
+                if self.run_in_thread:
+                    results = await asyncio.to_thread(self.process_fn, items)
+                else:
+                    results = self.process_fn(items)
             except Exception as e:
-                # Set exception for all futures
-                for _, future in batch_to_process:
-                    if not future.done():
-                        future.set_exception(e)
+                future.set_exception(e)
+            else:
+                future.set_result(results)
     
     async def _wait_for_batch(self):
         """Wait for a batch to be ready for processing."""
         # Wait for either the batch to be full or the timeout
-        timeout_task = asyncio.create_task(asyncio.sleep(self.max_wait_time))
-        event_task = asyncio.create_task(self._batch_event.wait())
-        
-        done, pending = await asyncio.wait(
-            [timeout_task, event_task],
-            return_when=asyncio.FIRST_COMPLETED
-        )
-        
-        # Cancel the remaining task
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        try:
+            await asyncio.wait_for(self._batch_event.wait(), self.max_wait_time)
+        except asyncio.TimeoutError:
+            pass
 
 
 class DynamicBatcher(Generic[T, U]):
@@ -156,7 +158,8 @@ class DynamicBatcher(Generic[T, U]):
         min_batch_size: int = 1,
         max_batch_size: int = 128,
         target_latency: float = 0.1,
-        adjustment_factor: float = 1.2
+        adjustment_factor: float = 1.2,
+        run_in_thread: bool = True
     ):
         """
         Initialize the dynamic batcher.
@@ -168,6 +171,7 @@ class DynamicBatcher(Generic[T, U]):
             max_batch_size: Maximum batch size
             target_latency: Target processing latency in seconds
             adjustment_factor: Factor by which to adjust batch size
+            run_in_thread: Whether to run process_fn in a worker thread
         """
         self.process_fn = process_fn
         self.min_batch_size = min_batch_size
@@ -179,13 +183,14 @@ class DynamicBatcher(Generic[T, U]):
         self._batch_processor = BatchProcessor(
             process_fn=self._process_batch_with_metrics,
             max_batch_size=self._current_batch_size,
-            max_wait_time=target_latency / 2
+            max_wait_time=target_latency / 2,
+            run_in_thread=run_in_thread
         )
         
         # Metrics for adjusting batch size
         self._last_batch_latency = 0.0
-        self._batch_history: List[float] = []
-        self._history_size = 10
+        self._ema_latency: Optional[float] = None
+        self._ema_alpha = 0.2
     
     async def start(self):
         """Start the dynamic batcher."""
@@ -217,18 +222,19 @@ class DynamicBatcher(Generic[T, U]):
         Returns:
             Batch of processed results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         results = self.process_fn(items)
         
         # Calculate and store latency
-        latency = time.time() - start_time
+        latency = time.perf_counter() - start_time
         self._last_batch_latency = latency
         
-        # Add to history and keep only the most recent entries
-        self._batch_history.append(latency)
-        if len(self._batch_history) > self._history_size:
-            self._batch_history.pop(0)
+        # Fold into an exponential moving average of recent latencies
+        if self._ema_latency is None:
+            self._ema_latency = latency
+        else:
+            self._ema_latency += self._ema_alpha * (latency - self._ema_latency)
         
         # Adjust batch size based on latency
         self._adjust_batch_size()
@@ -237,12 +243,10 @@ class DynamicBatcher(Generic[T, U]):
     
     def _adjust_batch_size(self):
         """Adjust batch size based on recent performance."""
-        if not self._batch_history:
+        avg_latency = self._ema_latency
+        if avg_latency is None:
             return
         
-        # Calculate average latency
-        avg_latency = sum(self._batch_history) / len(self._batch_history)
-        
         # Adjust batch size
         if avg_latency > self.target_latency * 1.1:  # Too slow
             new_size = max(
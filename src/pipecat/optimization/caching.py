@@ -1,23 +1,101 @@
 """
 Caching utilities for optimizing pipeline performance.
 """
+import atexit
+import functools
+import heapq
 import os
 import pickle
 import hashlib
 import json
+import math
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable, TypeVar, Generic, Union
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, TypeVar, Generic, Tuple, Union
 from pathlib import Path
 import threading
 import tempfile
+import weakref
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 T = TypeVar('T')
 
+# One-byte tags in front of PersistentCache payloads. Untagged files are
+# bare pickles written by earlier versions.
+_TAG_JSON = b"J"
+_TAG_PICKLE = b"P"
+
+# Bumped to 2 when cache filenames switched from MD5 to BLAKE2b
+_METADATA_VERSION = 2
+
+# Seconds between metadata writes caused only by access-time updates
+_METADATA_FLUSH_INTERVAL = 5.0
+
+# Open persistent caches, so deferred access times are saved at exit
+_live_caches: "weakref.WeakSet[PersistentCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_caches() -> None:
+    for cache in list(_live_caches):
+        cache.flush()
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Whether value round-trips through JSON unchanged (exact builtin types only)."""
+    kind = type(value)
+    if value is None or kind is str or kind is bool:
+        return True
+    if kind is int:
+        # orjson only encodes 64-bit integers
+        return -(1 << 63) <= value < (1 << 64)
+    if kind is float:
+        return math.isfinite(value)
+    if kind is list:
+        return all(_is_plain_json(v) for v in value)
+    if kind is dict:
+        return all(type(k) is str and _is_plain_json(v) for k, v in value.items())
+    return False
+
+
+def _serialize(value: Any) -> bytes:
+    """Encode a value, using orjson for plain JSON data and pickle otherwise."""
+    if orjson is not None and _is_plain_json(value):
+        try:
+            return _TAG_JSON + orjson.dumps(value)
+        except orjson.JSONEncodeError:
+            # e.g. strings holding lone surrogates, which pickle still handles
+            pass
+    return _TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@functools.lru_cache(maxsize=1024)
+def _key_filename(key: str) -> str:
+    """Filesystem-safe name for a cache key."""
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _deserialize(data: bytes) -> Any:
+    tag = data[:1]
+    if tag == _TAG_JSON:
+        return orjson.loads(data[1:]) if orjson is not None else json.loads(data[1:])
+    if tag == _TAG_PICKLE:
+        return pickle.loads(data[1:])
+    return pickle.loads(data)
+
 
 class ResultCache(ABC, Generic[T]):
     """Abstract base class for result caches."""
     
+    # Guards the lazy creation of each instance's compute-lock table, so
+    # subclasses don't have to call ResultCache.__init__
+    _compute_setup_lock = threading.Lock()
+    
     @abstractmethod
     def get(self, key: str) -> Optional[T]:
         """Get a cached result."""
@@ -44,63 +122,98 @@ class ResultCache(ABC, Generic[T]):
         pass
     
     def get_or_compute(self, key: str, compute_fn: Callable[[], T], ttl: Optional[int] = None) -> T:
-        """Get from cache or compute and cache the result."""
+        """Get from cache or compute and cache the result.
+
+        Concurrent callers that miss on the same key wait for a single
+        compute_fn call instead of each computing the value.
+        """
         if self.has(key):
             return self.get(key)
         
-        value = compute_fn()
-        self.set(key, value, ttl)
-        return value
+        compute_locks, compute_locks_lock = self._compute_lock_table()
+        with compute_locks_lock:
+            lock = compute_locks.get(key)
+            if lock is None:
+                lock = compute_locks[key] = threading.Lock()
+        
+        with lock:
+            # Another caller may have filled it while we waited
+            if self.has(key):
+                return self.get(key)
+            
+            try:
+                value = compute_fn()
+                self.set(key, value, ttl)
+            finally:
+                with compute_locks_lock:
+                    if compute_locks.get(key) is lock:
+                        del compute_locks[key]
+            return value
+    
+    def _compute_lock_table(self) -> Tuple[Dict[str, threading.Lock], threading.Lock]:
+        """Per-key locks held while a missing value is being computed, and their guard."""
+        table = getattr(self, "_compute_locks", None)
+        if table is None:
+            with ResultCache._compute_setup_lock:
+                table = getattr(self, "_compute_locks", None)
+                if table is None:
+                    self._compute_locks_lock = threading.Lock()
+                    table = self._compute_locks = {}
+        return table, self._compute_locks_lock
 
 
 class MemoryCache(ResultCache[T]):
     """In-memory implementation of ResultCache."""
     
     def __init__(self, max_size: int = 1000):
+        super().__init__()
         self.max_size = max_size
-        self._cache: Dict[str, Any] = {}
-        self._expiry: Dict[str, float] = {}
-        self._access_times: Dict[str, float] = {}
-        self._lock = threading.RLock()
+        # key -> (value, expiry or None), ordered from least to most recently used
+        self._cache: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        # No method calls back into another while holding it, so a plain Lock suffices
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[T]:
         """Get a cached result."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
             
             # Check if expired
-            if key in self._expiry and time.time() > self._expiry[key]:
-                self.invalidate(key)
+            value, expires = entry
+            if expires is not None and time.monotonic() > expires:
+                del self._cache[key]
                 return None
             
-            # Update access time for LRU
-            self._access_times[key] = time.time()
+            # Mark as most recently used
+            self._cache.move_to_end(key)
             
-            return self._cache[key]
+            return value
     
     def set(self, key: str, value: T, ttl: Optional[int] = None) -> None:
         """Set a cached result."""
         with self._lock:
-            # If cache is full, remove least recently used item
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                self._evict_lru()
-            
-            self._cache[key] = value
-            self._access_times[key] = time.time()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif self._cache and len(self._cache) >= self.max_size:
+                # Cache is full, remove least recently used item
+                self._cache.popitem(last=False)
             
-            if ttl is not None:
-                self._expiry[key] = time.time() + ttl
+            # Expiry uses the monotonic clock; these deadlines never leave the process
+            self._cache[key] = (value, time.monotonic() + ttl if ttl is not None else None)
     
     def has(self, key: str) -> bool:
         """Check if a key exists in the cache."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return False
             
             # Check if expired
-            if key in self._expiry and time.time() > self._expiry[key]:
-                self.invalidate(key)
+            expires = entry[1]
+            if expires is not None and time.monotonic() > expires:
+                del self._cache[key]
                 return False
             
             return True
@@ -108,27 +221,12 @@ class MemoryCache(ResultCache[T]):
     def invalidate(self, key: str) -> bool:
         """Invalidate a cached result."""
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._expiry.pop(key, None)
-                self._access_times.pop(key, None)
-                return True
-            return False
+            return self._cache.pop(key, None) is not None
     
     def clear(self) -> None:
         """Clear the entire cache."""
         with self._lock:
             self._cache.clear()
-            self._expiry.clear()
-            self._access_times.clear()
-    
-    def _evict_lru(self) -> None:
-        """Evict the least recently used item from the cache."""
-        if not self._access_times:
-            return
-        
-        lru_key = min(self._access_times.items(), key=lambda x: x[1])[0]
-        self.invalidate(lru_key)
 
 
 class PersistentCache(ResultCache[T]):
@@ -142,6 +240,7 @@ class PersistentCache(ResultCache[T]):
             cache_dir: Directory to store cache files (defaults to temp dir)
             max_size_mb: Maximum cache size in MB
         """
+        super().__init__()
         if cache_dir is None:
             cache_dir = os.path.join(tempfile.gettempdir(), "pipecat_cache")
         
@@ -149,34 +248,76 @@ class PersistentCache(ResultCache[T]):
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self._metadata_path = self.cache_dir / "metadata.json"
         self._lock = threading.RLock()
+        # Access times updated since metadata was last written
+        self._dirty = False
+        self._last_flush = time.time()
         
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Load metadata
         self._metadata = self._load_metadata()
+        if self._metadata.get("version", 1) < _METADATA_VERSION:
+            self._migrate_filenames()
+        self._reindex()
+        _live_caches.add(self)
+    
+    def _reindex(self) -> None:
+        """Rebuild the running size total and the eviction heap from metadata."""
+        items = self._metadata["items"]
+        self._total_size = sum(item.get("size", 0) for item in items.values())
+        # (last_access, key) min-heap; entries whose access time has since
+        # changed are stale and skipped when popped
+        self._lru_heap: List[Tuple[float, str]] = [
+            (item.get("last_access", 0), key) for key, item in items.items()
+        ]
+        heapq.heapify(self._lru_heap)
+    
+    def _touch(self, key: str, last_access: float) -> None:
+        """Record a new access time in the eviction heap."""
+        heapq.heappush(self._lru_heap, (last_access, key))
+        # Rebuild once stale entries outnumber live ones
+        if len(self._lru_heap) > 2 * len(self._metadata["items"]) + 64:
+            self._reindex()
     
     def _load_metadata(self) -> Dict[str, Any]:
         """Load cache metadata from disk."""
         if not self._metadata_path.exists():
-            return {"items": {}}
+            return {"items": {}, "version": _METADATA_VERSION}
         
         try:
             with open(self._metadata_path, "r") as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError):
-            return {"items": {}}
+            return {"items": {}, "version": _METADATA_VERSION}
     
     def _save_metadata(self) -> None:
         """Save cache metadata to disk."""
         with open(self._metadata_path, "w") as f:
             json.dump(self._metadata, f)
+        self._dirty = False
+        self._last_flush = time.time()
+    
+    def flush(self) -> None:
+        """Write out access times that haven't been saved yet."""
+        with self._lock:
+            if self._dirty:
+                self._save_metadata()
+    
+    def _migrate_filenames(self) -> None:
+        """Rename item files written under the older MD5 naming scheme."""
+        for key in self._metadata["items"]:
+            legacy_path = self.cache_dir / hashlib.md5(key.encode()).hexdigest()
+            if legacy_path.exists():
+                os.replace(legacy_path, self._get_path(key))
+        
+        self._metadata["version"] = _METADATA_VERSION
+        self._save_metadata()
     
     def _get_path(self, key: str) -> Path:
         """Get the path for a cache item."""
         # Use a hash of the key as the filename to avoid invalid chars
-        filename = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / filename
+        return self.cache_dir / _key_filename(key)
     
     def get(self, key: str) -> Optional[T]:
         """Get a cached result."""
@@ -187,21 +328,26 @@ class PersistentCache(ResultCache[T]):
             item_meta = self._metadata["items"][key]
             
             # Check if expired
-            if "expires" in item_meta and time.time() > item_meta["expires"]:
+            now = time.time()
+            if "expires" in item_meta and now > item_meta["expires"]:
                 self.invalidate(key)
                 return None
             
             # Load the item
             try:
                 with open(self._get_path(key), "rb") as f:
-                    value = pickle.load(f)
+                    value = _deserialize(f.read())
                 
-                # Update access time
-                self._metadata["items"][key]["last_access"] = time.time()
-                self._save_metadata()
+                # Update access time; saving it can wait, since it only
+                # affects eviction order
+                item_meta["last_access"] = now
+                self._touch(key, now)
+                self._dirty = True
+                if now - self._last_flush >= _METADATA_FLUSH_INTERVAL:
+                    self._save_metadata()
                 
                 return value
-            except (IOError, pickle.PickleError):
+            except (IOError, EOFError, ValueError, pickle.PickleError):
                 # If there's an error loading, invalidate the item
                 self.invalidate(key)
                 return None
@@ -212,22 +358,30 @@ class PersistentCache(ResultCache[T]):
             # Check if we need to make room
             self._ensure_space()
             
-            # Save the item
+            # Save the item, encoding it first so a failure can't leave a
+            # truncated file behind
+            data = _serialize(value)
             path = self._get_path(key)
             with open(path, "wb") as f:
-                pickle.dump(value, f)
+                f.write(data)
             
             # Update metadata
+            now = time.time()
             item_meta = {
-                "created": time.time(),
-                "last_access": time.time(),
+                "created": now,
+                "last_access": now,
                 "size": path.stat().st_size
             }
             
             if ttl is not None:
-                item_meta["expires"] = time.time() + ttl
+                item_meta["expires"] = now + ttl
             
+            previous = self._metadata["items"].get(key)
+            if previous is not None:
+                self._total_size -= previous.get("size", 0)
             self._metadata["items"][key] = item_meta
+            self._total_size += item_meta["size"]
+            self._touch(key, item_meta["last_access"])
             self._save_metadata()
     
     def has(self, key: str) -> bool:
@@ -256,18 +410,21 @@ class PersistentCache(ResultCache[T]):
             if key not in self._metadata["items"]:
                 return False
             
-            # Delete the file
-            try:
-                self._get_path(key).unlink(missing_ok=True)
-            except IOError:
-                pass
-            
-            # Update metadata
-            del self._metadata["items"][key]
+            self._remove_item(key)
             self._save_metadata()
             
             return True
     
+    def _remove_item(self, key: str) -> None:
+        """Delete an item's file and metadata without saving the metadata."""
+        try:
+            self._get_path(key).unlink(missing_ok=True)
+        except IOError:
+            pass
+        
+        item = self._metadata["items"].pop(key)
+        self._total_size -= item.get("size", 0)
+    
     def clear(self) -> None:
         """Clear the entire cache."""
         with self._lock:
@@ -276,29 +433,25 @@ class PersistentCache(ResultCache[T]):
                 self._get_path(key).unlink(missing_ok=True)
             
             # Reset metadata
-            self._metadata = {"items": {}}
+            self._metadata = {"items": {}, "version": _METADATA_VERSION}
+            self._reindex()
             self._save_metadata()
     
     def _ensure_space(self) -> None:
         """Ensure there's enough space in the cache."""
-        # Calculate current size
-        current_size = sum(
-            item.get("size", 0) for item in self._metadata["items"].values()
-        )
-        
         # If we're under the limit, we're good
-        if current_size <= self.max_size_bytes:
+        if self._total_size <= self.max_size_bytes:
             return
         
-        # Sort items by last access time
-        items = sorted(
-            ((k, v) for k, v in self._metadata["items"].items()),
-            key=lambda x: x[1].get("last_access", 0)
-        )
+        # Evict least recently used items until we're at 80% usage
+        items = self._metadata["items"]
+        target = self.max_size_bytes * 0.8
+        while self._total_size > target and self._lru_heap:
+            last_access, key = heapq.heappop(self._lru_heap)
+            item = items.get(key)
+            if item is None or item.get("last_access", 0) != last_access:
+                continue  # stale heap entry
+            self._remove_item(key)
         
-        # Delete items until we're under the limit
-        for key, item in items:
-            self.invalidate(key)
-            current_size -= item.get("size", 0)
-            if current_size <= self.max_size_bytes * 0.8:  # Aim for 80% usage
-                break
+        # One metadata write for the whole eviction pass
+        self._save_metadata()
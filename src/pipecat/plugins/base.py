@@ -3,11 +3,7 @@ Base plugin system components.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from pathlib import Path
-import importlib
-import inspect
-import pkgutil
-from typing import Dict, List, Type, TypeVar, Generic, Optional, Any, Set
+from typing import Dict, List, Type, TypeVar, Generic, Optional, Any
 
 
 class PluginError(Exception):
@@ -19,7 +15,11 @@ T = TypeVar('T')
 
 @dataclass
 class Plugin(ABC, Generic[T]):
-    """Base class for all plugins."""
+    """Base class for all plugins.
+
+    Plugins are registered under their class name, or under a class-level
+    default for ``name`` when a subclass declares one (``name: str = "foo"``).
+    """
     
     name: str
     version: str
@@ -40,65 +40,77 @@ class PluginManager:
     """Manages the discovery, loading and lifecycle of plugins."""
     
     def __init__(self):
-        self._plugins: Dict[str, Plugin] = {}
-        self._plugin_classes: Dict[str, Type[Plugin]] = {}
-        self._enabled_plugins: Set[str] = set()
+        # Each registered plugin owns a slot: its class, its loaded instance
+        # (None until loaded) and a bit in the enabled mask
+        self._index: Dict[str, int] = {}
+        self._classes: List[Type[Plugin]] = []
+        self._instances: List[Optional[Plugin]] = []
+        self._enabled_mask = 0
     
     def register_plugin_class(self, plugin_class: Type[Plugin]) -> None:
         """Register a plugin class."""
         if not issubclass(plugin_class, Plugin):
             raise PluginError(f"{plugin_class.__name__} is not a subclass of Plugin")
         
-        # Create a temporary instance to get the name
-        plugin = plugin_class(name=plugin_class.__name__, version="0.0.0")
-        self._plugin_classes[plugin.name] = plugin_class
+        # Read the name off the class; constructing one may have side effects
+        name = getattr(plugin_class, "name", None) or plugin_class.__name__
+        slot = self._index.get(name)
+        if slot is None:
+            self._index[name] = len(self._classes)
+            self._classes.append(plugin_class)
+            self._instances.append(None)
+        else:
+            self._classes[slot] = plugin_class
     
     def load_plugin(self, name: str, **kwargs) -> Plugin:
         """Load and initialize a plugin by name."""
-        if name in self._plugins:
-            return self._plugins[name]
-        
-        if name not in self._plugin_classes:
+        slot = self._index.get(name)
+        if slot is None:
             raise PluginError(f"No plugin registered with name: {name}")
         
-        plugin_class = self._plugin_classes[name]
-        plugin = plugin_class(**kwargs)
-        self._plugins[name] = plugin
+        plugin = self._instances[slot]
+        if plugin is None:
+            plugin = self._instances[slot] = self._classes[slot](**kwargs)
         return plugin
     
     def enable_plugin(self, name: str, app: Any) -> None:
         """Enable a plugin."""
-        if name not in self._plugins:
-            self.load_plugin(name)
-        
-        plugin = self._plugins[name]
+        plugin = self.load_plugin(name)
         plugin.initialize(app)
-        self._enabled_plugins.add(name)
+        self._enabled_mask |= 1 << self._index[name]
     
     def disable_plugin(self, name: str) -> None:
         """Disable a plugin."""
-        if name not in self._plugins or name not in self._enabled_plugins:
+        if not self.is_plugin_enabled(name):
             return
         
-        plugin = self._plugins[name]
-        plugin.cleanup()
-        self._enabled_plugins.remove(name)
+        slot = self._index[name]
+        self._instances[slot].cleanup()
+        self._enabled_mask &= ~(1 << slot)
     
     def get_plugin(self, name: str) -> Optional[Plugin]:
         """Get a loaded plugin by name."""
-        return self._plugins.get(name)
+        slot = self._index.get(name)
+        return None if slot is None else self._instances[slot]
     
     def get_all_plugins(self) -> List[Plugin]:
         """Get all loaded plugins."""
-        return list(self._plugins.values())
+        return [plugin for plugin in self._instances if plugin is not None]
     
     def get_enabled_plugins(self) -> List[Plugin]:
         """Get all enabled plugins."""
-        return [self._plugins[name] for name in self._enabled_plugins]
+        plugins = []
+        mask = self._enabled_mask
+        while mask:
+            low_bit = mask & -mask
+            plugins.append(self._instances[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return plugins
     
     def is_plugin_enabled(self, name: str) -> bool:
         """Check if a plugin is enabled."""
-        return name in self._enabled_plugins
+        slot = self._index.get(name)
+        return slot is not None and bool(self._enabled_mask >> slot & 1)
 
 
 # Default plugin manager instance
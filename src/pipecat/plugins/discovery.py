@@ -2,59 +2,199 @@
 Plugin discovery mechanisms.
 """
 import importlib
-import inspect
+import importlib.metadata
+import logging
+import os
 import pkgutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 from .base import Plugin, PluginManager, default_manager
 
 
-def discover_plugins(package_paths: List[str] = None) -> List[Type[Plugin]]:
+logger = logging.getLogger(__name__)
+
+
+# Entry point group that installed distributions use to advertise plugins
+ENTRY_POINT_GROUP = "pipecat.plugins"
+
+# Packages searched when discover_plugins isn't given any
+_DEFAULT_PKG_PATHS: Tuple[str, ...] = ("pipecat_plugins", "pipecat.contrib")
+
+# Threads used to import a package's submodules concurrently
+_IMPORT_WORKERS = 8
+
+# package path -> (mtimes of every directory under it, classes found there)
+_SCAN_CACHE: Dict[str, Tuple[Tuple[Tuple[str, int], ...], List[Type[Plugin]]]] = {}
+
+
+def _path_signature(package) -> Tuple[Tuple[str, int], ...]:
+    """Modification times of all directories under a package, to detect changes.
+
+    Adding or removing a module changes the mtime of the directory holding
+    it, so subpackages are included, not just the top-level ``__path__``.
+    """
+    signature = []
+    pending = list(package.__path__)
+    while pending:
+        directory = pending.pop()
+        try:
+            signature.append((directory, os.stat(directory).st_mtime_ns))
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name != "__pycache__" and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            signature.append((directory, -1))
+    signature.sort()
+    return tuple(signature)
+
+
+def _import(name: str):
+    """Import a module, skipping the import machinery if it's already loaded."""
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
+
+def _try_import(name: str) -> Optional[object]:
+    """Import a module, returning None if it can't be imported."""
+    try:
+        return _import(name)
+    except ImportError:
+        return None
+
+
+def _import_in_worker(name: str) -> Tuple[Optional[object], Optional[Exception]]:
+    """Import a module on a pool thread, returning failures other than ImportError."""
+    try:
+        return _import(name), None
+    except ImportError:
+        return None, None
+    except Exception as e:
+        return None, e
+
+
+def _plugin_classes_in(module_name: str) -> List[Type[Plugin]]:
+    """Plugin subclasses defined in a module, found by walking the subclass graph."""
+    found = []
+    seen = set()
+    pending = Plugin.__subclasses__()
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        pending.extend(cls.__subclasses__())
+        if cls.__module__ == module_name:
+            found.append(cls)
+    found.sort(key=lambda cls: cls.__name__)
+    return found
+
+
+def _entry_point_plugins() -> List[Type[Plugin]]:
+    """Load the Plugin classes advertised under ENTRY_POINT_GROUP."""
+    eps = importlib.metadata.entry_points()
+    if hasattr(eps, "select"):
+        eps = eps.select(group=ENTRY_POINT_GROUP)
+    else:
+        # Python 3.9 returns a dict of group -> entry points
+        eps = eps.get(ENTRY_POINT_GROUP, ())
+    
+    plugins = []
+    for ep in eps:
+        try:
+            plugin_class = ep.load()
+        except Exception:
+            # One broken distribution shouldn't stop discovery for the rest
+            logger.exception("Failed to load plugin entry point %r", ep.value)
+            continue
+        if isinstance(plugin_class, type) and issubclass(plugin_class, Plugin):
+            plugins.append(plugin_class)
+    return plugins
+
+
+def discover_plugins(package_paths: List[str] = None, walk: bool = True) -> List[Type[Plugin]]:
     """
-    Discover Plugin subclasses from specified packages.
+    Discover Plugin subclasses from installed entry points and specified packages.
+    
+    Distributions advertise plugins in their pyproject.toml, which only
+    imports the modules that actually declare one::
+    
+        [project.entry-points."pipecat.plugins"]
+        my_plugin = "my_package.plugin:MyPlugin"
     
     Args:
         package_paths: List of package paths to search for plugins
+        walk: Whether to also import every module under package_paths looking
+            for plugins; pass False to rely on entry points alone
         
     Returns:
         List of discovered Plugin subclasses
     """
-    if package_paths is None:
-        # Default to searching in common plugin directories
-        package_paths = [
-            "pipecat_plugins",
-            "pipecat.contrib"
-        ]
+    discovered_plugins = _entry_point_plugins()
+    for plugin_class in discovered_plugins:
+        default_manager.register_plugin_class(plugin_class)
     
-    discovered_plugins = []
+    if not walk:
+        return discovered_plugins
+    
+    if package_paths is None:
+        package_paths = _DEFAULT_PKG_PATHS
     
     for package_path in package_paths:
         try:
             # Try to import the package
-            package = importlib.import_module(package_path)
+            package = _import(package_path)
+            
+            # Reuse the previous scan if the package's directories are unchanged
+            signature = _path_signature(package)
+            cached = _SCAN_CACHE.get(package_path)
+            if cached is not None and cached[0] == signature:
+                discovered_plugins.extend(cached[1])
+                continue
+            
+            package_plugins = []
+            
+            # Walk through the package and its subpackages, then import the
+            # modules concurrently; imports mostly wait on file I/O
+            names = [
+                name for _, name, _ in
+                pkgutil.walk_packages(package.__path__, package.__name__ + '.')
+            ]
+            if len(names) > 1:
+                with ThreadPoolExecutor(max_workers=min(_IMPORT_WORKERS, len(names))) as executor:
+                    results = list(executor.map(_import_in_worker, names))
+                modules = []
+                for name, (module, error) in zip(names, results):
+                    if error is not None:
+                        # Some import-time code only works on the calling
+                        # thread (e.g. signal.signal on the main thread)
+                        logger.debug("Retrying import of %s on the calling thread: %r", name, error)
+                        module = _try_import(name)
+                    modules.append(module)
+            else:
+                modules = [_try_import(name) for name in names]
             
-            # Walk through the package and its subpackages
-            for loader, name, is_pkg in pkgutil.walk_packages(package.__path__, package.__name__ + '.'):
-                try:
-                    module = importlib.import_module(name)
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        
-                        # Check if it's a Plugin subclass but not Plugin itself
-                        if (inspect.isclass(attr) and 
-                            issubclass(attr, Plugin) and 
-                            attr != Plugin):
-                            discovered_plugins.append(attr)
-                            default_manager.register_plugin_class(attr)
-                except ImportError:
+            # Scan and register on this thread, in walk order
+            for name, module in zip(names, modules):
+                if module is None:
                     continue
+                for plugin_class in _plugin_classes_in(name):
+                    package_plugins.append(plugin_class)
+                    default_manager.register_plugin_class(plugin_class)
+            
+            _SCAN_CACHE[package_path] = (signature, package_plugins)
+            discovered_plugins.extend(package_plugins)
         except ImportError:
             # Skip packages that aren't installed
             continue
     
-    return discovered_plugins
+    # A plugin may be both advertised and found by walking its package
+    return list(dict.fromkeys(discovered_plugins))
 
 
 def discover_plugins_from_directory(directory: str) -> List[Type[Plugin]]:
@@ -84,17 +224,12 @@ def discover_plugins_from_directory(directory: str) -> List[Type[Plugin]]:
             
             try:
                 # Import the module
-                module = importlib.import_module(module_name)
+                _import(module_name)
                 
-                # Find Plugin subclasses
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    
-                    if (inspect.isclass(attr) and 
-                        issubclass(attr, Plugin) and 
-                        attr != Plugin):
-                        discovered_plugins.append(attr)
-                        default_manager.register_plugin_class(attr)
+                # Find Plugin subclasses defined in it
+                for plugin_class in _plugin_classes_in(module_name):
+                    discovered_plugins.append(plugin_class)
+                    default_manager.register_plugin_class(plugin_class)
             except ImportError:
                 continue
     finally:
@@ -2,6 +2,7 @@
 Project scaffolding utilities for creating new Pipecat projects.
 """
 import os
+import re
 import shutil
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -9,6 +10,17 @@ import json
 import jinja2
 
 
+# Jinja environments keyed by template directory, so templates are compiled
+# at most once per process
+_ENV_CACHE: Dict[str, jinja2.Environment] = {}
+
+# Template output pieces joined per write when streaming a render to disk
+_STREAM_BUFFER_EVENTS = 64
+
+# ``__name__`` placeholders in template file names
+_MARKER_RE = re.compile(r"__([a-zA-Z_][a-zA-Z0-9_]*?)__")
+
+
 class TemplateError(Exception):
     """Exception raised for template-related errors."""
     pass
@@ -86,12 +98,7 @@ def create_project(template_name: str,
     if variables:
         context.update(variables)
     
-    # Set up Jinja environment
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(template_dir)),
-        keep_trailing_newline=True,
-        autoescape=False,
-    )
+    env = _get_environment(template_dir)
     
     # Process all files in the template directory
     for template_file in _list_template_files(template_dir):
@@ -103,11 +110,10 @@ def create_project(template_name: str,
         
         # Path in output directory, replacing template variables in filename
         output_file_path_str = str(relative_path)
-        for key, value in context.items():
-            if isinstance(value, str):
-                output_file_path_str = output_file_path_str.replace(
-                    f"__{key}__", value
-                )
+        if "__" in output_file_path_str:
+            output_file_path_str = _MARKER_RE.sub(
+                lambda m: _marker_value(context, m), output_file_path_str
+            )
         
         output_file_path = output_path / output_file_path_str
         
@@ -121,13 +127,12 @@ def create_project(template_name: str,
                 output_file_path.name[:-3]
             )
             
-            # Render the template
+            # Render the template straight to the output file, a few
+            # chunks at a time rather than building the whole string
             template = env.get_template(str(relative_path))
-            rendered_content = template.render(**context)
-            
-            # Write the rendered content to the output file
-            with open(output_file_path, "w", encoding="utf-8") as f:
-                f.write(rendered_content)
+            stream = template.stream(**context)
+            stream.enable_buffering(_STREAM_BUFFER_EVENTS)
+            stream.dump(str(output_file_path), encoding="utf-8")
         else:
             # Copy the file directly
             shutil.copy2(template_file, output_file_path)
@@ -136,10 +141,39 @@ def create_project(template_name: str,
     return output_path
 
 
+def _marker_value(context: Dict[str, Any], match: re.Match) -> str:
+    """Substitute a string context value for a filename marker, else keep it."""
+    value = context.get(match.group(1))
+    return value if isinstance(value, str) else match.group(0)
+
+
+def _get_environment(template_dir: Path) -> jinja2.Environment:
+    """Return the shared Jinja environment for a template directory."""
+    env = _ENV_CACHE.get(str(template_dir))
+    if env is None:
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(template_dir)),
+            keep_trailing_newline=True,
+            autoescape=False,
+            # Bundled templates don't change while the process runs
+            auto_reload=False,
+            # Without a directory, Jinja uses a private per-user temp directory
+            bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        )
+        _ENV_CACHE[str(template_dir)] = env
+    return env
+
+
 def _list_template_files(directory: Path) -> List[Path]:
     """Recursively list all files in a directory."""
     files = []
-    for path in directory.glob("**/*"):
-        if path.is_file():
-            files.append(path)
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                # Like Path.glob("**"), don't descend into symlinked directories
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    files.append(Path(entry.path))
     return files
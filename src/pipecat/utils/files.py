@@ -0,0 +1,43 @@
+#
+# Copyright (c) 2024–2025, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import stat
+from typing import Union
+
+
+def write_atomic(path: Union[str, os.PathLike], data: bytes, mode: int = 0o666) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file.
+
+    The data is written to a uniquely named temporary file in the same
+    directory, which is then renamed over ``path``. The temporary file is
+    removed if anything fails before the rename. Like ``open(path, "w")``, an
+    existing file keeps its permissions and a new one gets ``mode`` minus the
+    process umask.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or "."
+    prefix = f".{os.path.basename(path)}."
+    while True:
+        tmp_path = os.path.join(directory, prefix + os.urandom(6).hex())
+        try:
+            # The kernel applies the umask to the mode, as open() would
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            break
+        except FileExistsError:
+            continue
+    try:
+        # A file object retries short writes until all the data is written
+        with open(fd, "wb") as f:
+            f.write(data)
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
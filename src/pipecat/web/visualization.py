@@ -2,11 +2,13 @@
 Pipeline visualization utilities for Pipecat web interfaces.
 """
 import json
+import os
 from typing import Dict, Any, List, Optional, Tuple
 import networkx as nx
 from pathlib import Path
 
 from ..pipeline import Pipeline
+from ..utils.files import write_atomic
 
 
 class PipelineVisualizer:
@@ -271,15 +273,13 @@ class PipelineVisualizer:
         os.makedirs(path.parent, exist_ok=True)
         
         if format.lower() == "html":
-            with open(path, "w") as f:
-                f.write(self.to_html(pipeline))
+            content = self.to_html(pipeline)
         elif format.lower() == "mermaid":
-            with open(path, "w") as f:
-                f.write(self.to_mermaid(pipeline))
+            content = self.to_mermaid(pipeline)
         elif format.lower() == "json":
-            with open(path, "w") as f:
-                json.dump(self.to_json(pipeline), f, indent=2)
+            content = json.dumps(self.to_json(pipeline), indent=2)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
+        write_atomic(path, content.encode("utf-8"))
         return path
@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import argparse
+import contextlib
+import io
+import os
+import unittest
+from unittest import mock
+
+from pipecat import cli
+from pipecat.cli import main
+
+
+def _reference_parser() -> argparse.ArgumentParser:
+    """The argparse parser the static help stands in for."""
+    parser = argparse.ArgumentParser(prog="pipecat", description="Pipecat CLI")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    for name, (help_text, _) in cli._COMMANDS.items():
+        subparsers.add_parser(name, help=help_text)
+    return parser
+
+
+def _run(args):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            code = main(args)
+        except SystemExit as e:
+            code = e.code
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestCLI(unittest.TestCase):
+    def test_static_help_matches_argparse(self):
+        with mock.patch.dict(os.environ, {"COLUMNS": "80"}):
+            expected = _reference_parser().format_help()
+
+        assert cli._STATIC_HELP == expected
+        assert _run(["--help"]) == (0, expected, "")
+        assert _run([]) == (1, expected, "")
+
+    def test_dispatches_to_commands(self):
+        with mock.patch.object(cli, "create_new_project", return_value=0) as new:
+            assert _run(["new", "bot", "--template", "voice"])[0] == 0
+        new.assert_called_once_with("bot", "voice")
+
+        with mock.patch.object(cli, "run_example", return_value=0) as example:
+            assert _run(["example", "hello"])[0] == 0
+        example.assert_called_once_with("hello")
+
+    def test_unknown_command(self):
+        code, stdout, stderr = _run(["bogus"])
+
+        assert code == 2
+        assert stdout == ""
+        assert stderr.startswith("usage: pipecat [-h] {new,example,dashboard} ...\n")
+        assert "invalid choice: 'bogus'" in stderr
+
+    def test_command_usage_names_the_subcommand(self):
+        code, stdout, _ = _run(["dashboard", "--help"])
+        assert code == 0
+        assert stdout.startswith("usage: pipecat dashboard ")
+
+        code, _, stderr = _run(["new"])
+        assert code == 2
+        assert stderr.startswith("usage: pipecat new ")
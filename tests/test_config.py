@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import unittest
+from unittest import mock
+
+from pipecat.config import PipecatConfig, _read_env, default_config
+
+
+class TestPipecatConfig(unittest.TestCase):
+    def setUp(self):
+        _read_env.cache_clear()
+
+    def tearDown(self):
+        _read_env.cache_clear()
+
+    def test_reads_environment(self):
+        env = {"APP_DEBUG": "Yes", "APP_LOG_LEVEL": "DEBUG", "APP_CACHE_DIR": "/tmp/cache"}
+        with mock.patch.dict(os.environ, env):
+            config = PipecatConfig.from_env(prefix="APP_")
+
+        assert config == PipecatConfig(debug=True, log_level="DEBUG", cache_dir="/tmp/cache")
+
+    def test_defaults_without_environment(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            assert PipecatConfig.from_env() == PipecatConfig()
+
+    def test_returns_independent_instances(self):
+        with mock.patch.dict(os.environ, {"PIPECAT_DEBUG": "false"}):
+            first = PipecatConfig.from_env()
+            first.debug = True
+            second = PipecatConfig.from_env()
+
+        assert first is not second
+        assert second.debug is False
+        assert PipecatConfig.from_env() is not default_config
+
+    def test_environment_is_read_once_per_prefix(self):
+        with mock.patch.dict(os.environ, {"PIPECAT_LOG_LEVEL": "WARNING"}):
+            assert PipecatConfig.from_env().log_level == "WARNING"
+        with mock.patch.dict(os.environ, {"PIPECAT_LOG_LEVEL": "ERROR"}):
+            assert PipecatConfig.from_env().log_level == "WARNING"
+            _read_env.cache_clear()
+            assert PipecatConfig.from_env().log_level == "ERROR"
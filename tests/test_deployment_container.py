@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import contextlib
+import io
+import os
+import stat
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pipecat.deployment import DockerBuilder, DockerConfig
+
+
+def _reference_dockerfile(config: DockerConfig) -> str:
+    """The line-by-line rendering the Dockerfile template replaced."""
+    lines = [
+        f"FROM {config.base_image}",
+        "",
+        f"WORKDIR {config.working_dir}",
+        "",
+        "# Set environment variables",
+        "ENV PYTHONDONTWRITEBYTECODE=1 \\",
+        "    PYTHONUNBUFFERED=1 \\",
+        f"    PYTHONPATH={config.working_dir}",
+    ]
+    for key, value in config.environment.items():
+        lines.append(f"ENV {key}={value}")
+    if config.extra_packages:
+        lines.extend([
+            "",
+            "# Install system dependencies",
+            "RUN apt-get update && apt-get install -y --no-install-recommends \\",
+            "    " + " \\\n    ".join(config.extra_packages) + " \\",
+            "    && apt-get clean \\",
+            "    && rm -rf /var/lib/apt/lists/*",
+        ])
+    deps_target = "[all]" if config.install_dev_deps else ""
+    lines.extend([
+        "",
+        "# Copy project files",
+        f"COPY . {config.working_dir}/",
+        "",
+        "# Install dependencies",
+        f'RUN pip install --no-cache-dir -e ".{deps_target}"',
+        "",
+        "# Default command",
+        'CMD ["python", "-m", "pipecat.cli"]',
+    ])
+    return "\n".join(lines)
+
+
+class TestDockerConfig(unittest.TestCase):
+    def test_matches_reference_rendering(self):
+        configs = [
+            DockerConfig(),
+            DockerConfig(install_dev_deps=True, working_dir="/srv"),
+            DockerConfig(extra_packages=["ffmpeg"], environment={"A": "1"}),
+            DockerConfig(
+                base_image="python:3.12",
+                extra_packages=["ffmpeg", "libsndfile1"],
+                environment={"A": "1", "B": "two words"},
+            ),
+        ]
+        for config in configs:
+            assert config.to_dockerfile() == _reference_dockerfile(config)
+
+    def test_reflects_mutations(self):
+        config = DockerConfig()
+        config.to_dockerfile()
+        config.extra_packages.append("ffmpeg")
+        config.environment["A"] = "1"
+
+        assert config.to_dockerfile() == _reference_dockerfile(config)
+
+
+class TestDockerBuilder(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_generate_dockerfile(self):
+        path = self.root / "build" / "Dockerfile"
+        config = DockerConfig(extra_packages=["ffmpeg"])
+
+        DockerBuilder(config).generate_dockerfile(str(path))
+
+        assert path.read_text() == _reference_dockerfile(config)
+        assert [p.name for p in path.parent.iterdir()] == ["Dockerfile"]
+
+    def test_unchanged_dockerfile_is_not_rewritten(self):
+        path = self.root / "Dockerfile"
+        builder = DockerBuilder()
+        builder.generate_dockerfile(str(path))
+        os.utime(path, ns=(0, 0))
+
+        with mock.patch("pipecat.deployment.container.write_atomic") as write:
+            builder.generate_dockerfile(str(path))
+
+        write.assert_not_called()
+        assert path.stat().st_mtime_ns == 0
+
+        builder.config.environment["A"] = "1"
+        builder.generate_dockerfile(str(path))
+
+        assert path.read_text() == _reference_dockerfile(builder.config)
+
+    def test_file_in_current_directory(self):
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            DockerBuilder().generate_dockerfile("Dockerfile")
+        finally:
+            os.chdir(cwd)
+
+        assert (self.root / "Dockerfile").read_text() == _reference_dockerfile(DockerConfig())
+
+
+class TestBuildImage(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        bin_dir = Path(self._tmp.name)
+        docker = bin_dir / "docker"
+        # Prints a BuildKit progress line, a line that isn't valid UTF-8 and
+        # a line on stderr
+        docker.write_text(
+            textwrap.dedent(
+                """\
+                #!/bin/sh
+                printf '#1 0.123 step\\nhello \\377 world\\n'
+                printf 'err line\\n' >&2
+                exit ${FAKE_RC:-0}
+                """
+            )
+        )
+        docker.chmod(docker.stat().st_mode | stat.S_IXUSR)
+        path = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        self._env = mock.patch.dict(os.environ, {"PATH": path})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def _build(self, **kwargs):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            ok = DockerBuilder().build_image("test:latest", **kwargs)
+        return ok, stdout.getvalue()
+
+    def test_quiet_filters_progress(self):
+        ok, output = self._build(quiet=True)
+
+        assert ok
+        assert output == "hello � world\nerr line\n"
+
+    def test_failure(self):
+        os.environ["FAKE_RC"] = "3"
+
+        ok, output = self._build(quiet=True)
+
+        assert not ok
+        assert "Error building Docker image" in output
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import json
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from pipecat.deployment import FlyIODeployer, HerokuDeployer, ModalDeployer
+
+
+def _completed(payload) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess([], 0, stdout=json.dumps(payload).encode())
+
+
+class TestGetStatus(unittest.TestCase):
+    def _status(self, deployer, app_name, payload):
+        with mock.patch("subprocess.run", return_value=_completed(payload)) as run:
+            status = deployer.get_status(app_name)
+        assert "--json" in run.call_args.args[0]
+        return status
+
+    def test_fly(self):
+        deployer = FlyIODeployer()
+        running = {"Machines": [{"state": "stopped"}, {"state": "started"}]}
+        stopped = {"Machines": [{"state": "stopped"}]}
+
+        assert self._status(deployer, "app", running) == {"status": "running"}
+        assert self._status(deployer, "app", stopped) == {"status": "stopped"}
+        assert self._status(deployer, "app", {"Machines": None}) == {"status": "stopped"}
+
+    def test_modal(self):
+        deployer = ModalDeployer()
+        apps = [
+            {"Description": "other", "State": "deployed"},
+            {"Description": "app", "State": "stopped"},
+        ]
+
+        assert self._status(deployer, "app", apps) == {"status": "stopped"}
+        assert self._status(deployer, "other", apps) == {"status": "running"}
+        assert self._status(deployer, "missing", apps) == {"status": "stopped"}
+
+    def test_heroku(self):
+        deployer = HerokuDeployer()
+
+        assert self._status(deployer, "app", [{"state": "crashed"}, {"state": "up"}]) == {
+            "status": "running"
+        }
+        assert self._status(deployer, "app", [{"state": "crashed"}]) == {"status": "stopped"}
+
+    def test_unparseable_output(self):
+        result = subprocess.CompletedProcess([], 0, stdout=b"not json")
+        for deployer in (FlyIODeployer(), ModalDeployer(), HerokuDeployer()):
+            with mock.patch("subprocess.run", return_value=result):
+                assert deployer.get_status("app")["status"] == "unknown"
+
+    def test_command_failure(self):
+        error = subprocess.CalledProcessError(1, ["status"])
+        for deployer in (FlyIODeployer(), ModalDeployer(), HerokuDeployer()):
+            with mock.patch("subprocess.run", side_effect=error):
+                assert deployer.get_status("app")["status"] == "unknown"
+
+
+class TestHerokuDeploy(unittest.TestCase):
+    def test_config_set_in_one_call(self):
+        deployer = HerokuDeployer()
+        with tempfile.TemporaryDirectory() as app_path:
+            with mock.patch("subprocess.run") as run:
+                assert deployer.deploy(
+                    app_path, app_name="app", env_vars={"A": "1", "B": "two words"}
+                )
+
+        config_calls = [
+            call.args[0] for call in run.call_args_list if "config:set" in call.args[0]
+        ]
+        assert config_calls == [
+            [deployer._heroku, "config:set", "A=1", "B=two words", "-a", "app"]
+        ]
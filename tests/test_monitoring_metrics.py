@@ -0,0 +1,179 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import statistics
+import sys
+import threading
+import unittest
+from unittest import mock
+
+from pipecat.monitoring.metrics import Metric, MetricsCollector, MetricType, _shard_count
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_counter_totals(self):
+        collector = MetricsCollector()
+        collector.counter("requests")
+        collector.counter("requests", 2)
+        collector.counter("requests", 4, tags={"route": "/a"})
+
+        metrics = collector.metrics["requests"]
+        assert len(metrics) == 1
+        assert metrics[0].type == MetricType.COUNTER
+        assert metrics[0].value == 7
+        assert metrics[0].tags == {"route": "/a"}
+
+        stats = collector.get_stats()["requests"]
+        assert stats["total"] == 7
+        assert stats["latest"] == 4
+
+    def test_gauge_stats_match_statistics(self):
+        collector = MetricsCollector()
+        values = [3.0, 1.5, 8.25, 4.0, 4.0, 10.0, -2.5]
+        for value in values:
+            collector.gauge("load", value)
+
+        stats = collector.get_stats()["load"]
+        assert stats["min"] == min(values)
+        assert stats["max"] == max(values)
+        assert stats["count"] == len(values)
+        self.assertAlmostEqual(stats["mean"], statistics.mean(values))
+        self.assertAlmostEqual(stats["median"], statistics.median(values))
+        self.assertAlmostEqual(stats["stddev"], statistics.stdev(values))
+        assert stats["latest"] == values[-1]
+
+    def test_histogram_stats_match_statistics(self):
+        collector = MetricsCollector()
+        values = [float(v) for v in range(1, 1001)]
+        for value in values:
+            collector.histogram("latency", value)
+
+        stats = collector.get_stats()["latency"]
+        assert stats["min"] == 1.0
+        assert stats["max"] == 1000.0
+        assert stats["count"] == len(values)
+        self.assertAlmostEqual(stats["mean"], statistics.mean(values))
+        self.assertAlmostEqual(stats["median"], statistics.median(values))
+        self.assertAlmostEqual(stats["stddev"], statistics.stdev(values))
+        self.assertAlmostEqual(stats["p90"], 900.1)
+        self.assertAlmostEqual(stats["p99"], 990.01)
+
+    def test_histogram_quantiles_of_few_samples(self):
+        collector = MetricsCollector()
+        for value in (1.0, 2.0, 3.0):
+            collector.histogram("small", value)
+
+        stats = collector.get_stats()["small"]
+        assert stats["median"] == 2.0
+        self.assertAlmostEqual(stats["p90"], 2.8)
+        self.assertAlmostEqual(stats["p99"], 2.98)
+
+    def test_samples_from_other_threads_are_flushed(self):
+        collector = MetricsCollector()
+        recorded = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            # Fewer samples than the flush threshold, so they stay buffered
+            for i in range(10):
+                collector.gauge("worker", i, tags={"thread": "worker"})
+            recorded.set()
+            release.wait()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        try:
+            recorded.wait()
+            metrics = collector.metrics["worker"]
+            assert [m.value for m in metrics] == list(range(10))
+            assert all(m.tags == {"thread": "worker"} for m in metrics)
+        finally:
+            release.set()
+            thread.join()
+
+        # The exited thread's buffer is dropped without losing anything
+        collector.gauge("worker", 10)
+        assert collector.get_stats()["worker"]["count"] == 11
+
+    def test_concurrent_flushes(self):
+        collector = MetricsCollector()
+        errors = []
+
+        def writer(i):
+            collector.gauge("short_lived", i)
+
+        def reader():
+            try:
+                for _ in range(20):
+                    collector.flush()
+            except Exception as e:
+                errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            writers = [threading.Thread(target=writer, args=(i,)) for i in range(50)]
+            for thread in writers:
+                thread.start()
+            for thread in writers:
+                thread.join()
+            readers = [threading.Thread(target=reader) for _ in range(8)]
+            for thread in readers:
+                thread.start()
+            for thread in readers:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        assert collector.get_stats()["short_lived"]["count"] == 50
+        assert collector._buffers == []
+
+    def test_record_rejects_bad_values(self):
+        collector = MetricsCollector()
+        with self.assertRaises(TypeError):
+            collector.gauge("bad", None)
+        with self.assertRaises(TypeError):
+            collector.record(Metric("bad", None, MetricType.HISTOGRAM))
+        assert collector.get_stats() == {}
+
+    def test_reset(self):
+        collector = MetricsCollector()
+        for i in range(100):
+            collector.gauge("per_request", i, tags={"request_id": str(i)})
+        collector.counter("requests", 100)
+        snapshot = collector.metrics
+
+        collector.reset()
+
+        assert collector.metrics == {}
+        assert collector.get_stats() == {}
+        assert len(collector._tag_table) == 1
+        # Snapshots taken before the reset still resolve their tags
+        assert snapshot["per_request"][42].tags == {"request_id": "42"}
+
+    def test_collectors_do_not_share_tags(self):
+        first = MetricsCollector()
+        second = MetricsCollector()
+        first.gauge("a", 1, tags={"only": "first"})
+        second.gauge("a", 2, tags={"only": "second"})
+
+        assert first.metrics["a"][0].tags == {"only": "first"}
+        assert second.metrics["a"][0].tags == {"only": "second"}
+
+
+class TestShardCount(unittest.TestCase):
+    def test_rounds_up_to_power_of_two(self):
+        with mock.patch.dict("os.environ", {"PIPECAT_METRICS_SHARDS": "5"}):
+            assert _shard_count() == 8
+        with mock.patch.dict("os.environ", {"PIPECAT_METRICS_SHARDS": "0"}):
+            assert _shard_count() == 1
+
+    def test_invalid_value_uses_default(self):
+        with mock.patch.dict("os.environ", {"PIPECAT_METRICS_SHARDS": "many"}):
+            assert _shard_count() == 16
+        with mock.patch.dict("os.environ", {"PIPECAT_METRICS_SHARDS": ""}):
+            assert _shard_count() == 16
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+import unittest
+
+from pipecat.optimization.batching import BatchProcessor
+
+
+def double(items):
+    return [item * 2 for item in items]
+
+
+class TestBatchProcessor(unittest.IsolatedAsyncioTestCase):
+    async def test_results_match_callers(self):
+        batches = []
+
+        def process(items):
+            batches.append(list(items))
+            return double(items)
+
+        processor = BatchProcessor(process, max_batch_size=4, max_wait_time=0.05)
+        await processor.start()
+        try:
+            results = await asyncio.gather(*(processor.process(i) for i in range(10)))
+        finally:
+            await processor.stop()
+
+        assert results == [i * 2 for i in range(10)]
+        assert sorted(item for batch in batches for item in batch) == list(range(10))
+
+    async def test_inline_processing(self):
+        processor = BatchProcessor(double, max_batch_size=2, run_in_thread=False)
+        await processor.start()
+        try:
+            assert await asyncio.gather(processor.process(1), processor.process(2)) == [2, 4]
+        finally:
+            await processor.stop()
+
+    async def test_errors_reach_every_caller(self):
+        def fail(items):
+            raise ValueError("boom")
+
+        processor = BatchProcessor(fail, max_batch_size=2, max_wait_time=0.01)
+        await processor.start()
+        try:
+            results = await asyncio.gather(
+                processor.process(1), processor.process(2), return_exceptions=True
+            )
+        finally:
+            await processor.stop()
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_cancelling_one_caller_keeps_the_batch(self):
+        def slow(items):
+            time.sleep(0.3)
+            return double(items)
+
+        processor = BatchProcessor(slow, max_batch_size=2, max_wait_time=0.01)
+        await processor.start()
+        try:
+            other = asyncio.create_task(processor.process(2))
+            begin = time.monotonic()
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(processor.process(1), 0.05)
+            # The timeout fires on time instead of waiting for the batch
+            assert time.monotonic() - begin < 0.25
+            assert await other == 4
+        finally:
+            await processor.stop()
+
+    async def test_stop_releases_waiting_callers(self):
+        processor = BatchProcessor(double, max_batch_size=10, max_wait_time=60)
+        await processor.start()
+        task = asyncio.create_task(processor.process(1))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(processor.stop(), 1)
+
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 1)
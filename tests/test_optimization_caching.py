@@ -0,0 +1,183 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import hashlib
+import json
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from pipecat.optimization.caching import MemoryCache, PersistentCache, ResultCache
+
+
+class DictCache(ResultCache):
+    """A subclass that doesn't call ResultCache.__init__."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+    def has(self, key):
+        return key in self.data
+
+    def invalidate(self, key):
+        return self.data.pop(key, None) is not None
+
+    def clear(self):
+        self.data.clear()
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        assert cache.has("a")
+        assert not cache.has("b")
+        assert cache.get("c") == 3
+
+    def test_overwrite_does_not_evict(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+
+    def test_zero_size(self):
+        cache = MemoryCache(max_size=0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") is None
+
+    def test_ttl(self):
+        cache = MemoryCache()
+        cache.set("a", 1, ttl=0)
+        time.sleep(0.01)
+        assert cache.get("a") is None
+        assert not cache.has("a")
+
+    def test_get_or_compute_computes_once(self):
+        cache = MemoryCache()
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(cache.get_or_compute("key", compute))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["value"] * 8
+        assert cache._compute_locks == {}
+
+
+class TestResultCache(unittest.TestCase):
+    def test_get_or_compute_without_base_init(self):
+        cache = DictCache()
+        assert cache.get_or_compute("key", lambda: 42) == 42
+        assert cache.get_or_compute("key", lambda: 0) == 42
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        cache = PersistentCache(str(self.cache_dir))
+        values = {
+            "json": {"a": [1, 2.5, None, True], "b": "text"},
+            "tuple": (1, 2),
+            "set": {1, 2},
+            "bytes": b"\x00\x01",
+            "surrogate": "\ud800",
+        }
+        for key, value in values.items():
+            cache.set(key, value)
+
+        reopened = PersistentCache(str(self.cache_dir))
+        for key, value in values.items():
+            assert reopened.get(key) == value
+
+    def test_unencodable_value_keeps_entry_readable(self):
+        cache = PersistentCache(str(self.cache_dir))
+        cache.set("key", "first")
+        cache.set("key", "lone \ud800 surrogate")
+        assert cache.get("key") == "lone \ud800 surrogate"
+
+    def test_truncated_file_is_invalidated(self):
+        cache = PersistentCache(str(self.cache_dir))
+        cache.set("key", [1, 2, 3])
+        cache._get_path("key").write_bytes(b"")
+
+        assert cache.get("key") is None
+        assert not cache.has("key")
+
+    def test_evicts_least_recently_used(self):
+        cache = PersistentCache(str(self.cache_dir), max_size_mb=1)
+        blob = b"x" * (400 * 1024)
+        cache.set("a", blob)
+        time.sleep(0.01)
+        cache.set("b", blob)
+        time.sleep(0.01)
+        assert cache.get("a") == blob  # "b" is now the least recently used
+        time.sleep(0.01)
+        cache.set("c", blob)
+        # Space is reclaimed before the next write once the cache is over its limit
+        cache.set("d", b"small")
+
+        assert cache.has("a")
+        assert not cache.has("b")
+        assert cache.has("c")
+        assert cache.has("d")
+
+    def test_migrates_md5_filenames(self):
+        # Layout written before filenames switched to BLAKE2b: bare pickles
+        # named by the key's MD5, and metadata without a version
+        now = time.time()
+        items = {}
+        for key, value in {"alpha": [1, 2], "beta": {"x": 1}}.items():
+            path = self.cache_dir / hashlib.md5(key.encode()).hexdigest()
+            path.write_bytes(pickle.dumps(value))
+            items[key] = {"created": now, "last_access": now, "size": path.stat().st_size}
+        (self.cache_dir / "metadata.json").write_text(json.dumps({"items": items}))
+
+        cache = PersistentCache(str(self.cache_dir))
+
+        assert cache.get("alpha") == [1, 2]
+        assert cache.get("beta") == {"x": 1}
+        for key in items:
+            assert not (self.cache_dir / hashlib.md5(key.encode()).hexdigest()).exists()
+        metadata = json.loads((self.cache_dir / "metadata.json").read_text())
+        assert metadata["version"] == 2
@@ -0,0 +1,171 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import importlib
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+from pipecat.plugins import Plugin, PluginError, PluginManager, discover_plugins
+
+PLUGIN_SOURCE = textwrap.dedent(
+    """
+    from dataclasses import dataclass
+
+    from pipecat.plugins import Plugin
+
+
+    @dataclass
+    class {cls}(Plugin):
+        name: str = "{name}"
+        version: str = "1.0"
+
+        def initialize(self, app):
+            pass
+    """
+)
+
+
+@dataclass
+class RecordingPlugin(Plugin):
+    name: str = "recording"
+    version: str = "1.0"
+
+    def __post_init__(self):
+        self.events = []
+
+    def initialize(self, app):
+        self.events.append(("initialize", app))
+
+    def cleanup(self):
+        self.events.append(("cleanup",))
+
+
+@dataclass
+class OtherPlugin(Plugin):
+    name: str = "other"
+    version: str = "1.0"
+
+    def initialize(self, app):
+        pass
+
+
+class TestPluginManager(unittest.TestCase):
+    def test_register_does_not_instantiate(self):
+        manager = PluginManager()
+        manager.register_plugin_class(RecordingPlugin)
+
+        assert manager.get_plugin("recording") is None
+        assert manager.get_all_plugins() == []
+
+    def test_register_rejects_non_plugins(self):
+        with self.assertRaises(PluginError):
+            PluginManager().register_plugin_class(object)
+
+    def test_load_unknown_plugin(self):
+        with self.assertRaises(PluginError):
+            PluginManager().load_plugin("missing")
+
+    def test_enable_and_disable(self):
+        manager = PluginManager()
+        manager.register_plugin_class(RecordingPlugin)
+        manager.register_plugin_class(OtherPlugin)
+
+        manager.enable_plugin("other", app="app")
+        manager.enable_plugin("recording", app="app")
+        plugin = manager.get_plugin("recording")
+
+        assert manager.is_plugin_enabled("recording")
+        assert [p.name for p in manager.get_enabled_plugins()] == ["recording", "other"]
+
+        manager.disable_plugin("recording")
+
+        assert not manager.is_plugin_enabled("recording")
+        assert plugin.events == [("initialize", "app"), ("cleanup",)]
+        assert [p.name for p in manager.get_enabled_plugins()] == ["other"]
+        # Disabling keeps the loaded instance around
+        assert manager.get_plugin("recording") is plugin
+
+
+class TestDiscoverPlugins(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        sys.path.insert(0, str(self.root))
+
+    def tearDown(self):
+        sys.path.remove(str(self.root))
+        for name in list(sys.modules):
+            if name.split(".")[0] in ("rescanplugs", "epplugs", "mainplugs"):
+                del sys.modules[name]
+        importlib.invalidate_caches()
+        self._tmp.cleanup()
+
+    def _write(self, relative_path: str, source: str = ""):
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+
+    def _write_plugin(self, relative_path: str, cls: str, name: str):
+        self._write(relative_path, PLUGIN_SOURCE.format(cls=cls, name=name))
+
+    def test_rescans_after_subpackage_changes(self):
+        self._write("rescanplugs/__init__.py")
+        self._write("rescanplugs/sub/__init__.py")
+        self._write_plugin("rescanplugs/a.py", "APlugin", "test-a")
+
+        found = discover_plugins(["rescanplugs"])
+        assert [cls.__name__ for cls in found] == ["APlugin"]
+
+        # Make sure the directory's mtime moves even on coarse filesystems
+        sub = self.root / "rescanplugs" / "sub"
+        self._write_plugin("rescanplugs/sub/c.py", "CPlugin", "test-c")
+        stat = sub.stat()
+        os.utime(sub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        importlib.invalidate_caches()
+
+        found = discover_plugins(["rescanplugs"])
+        assert [cls.__name__ for cls in found] == ["APlugin", "CPlugin"]
+
+    def test_broken_entry_point_is_skipped(self):
+        self._write("epplugs/__init__.py")
+        self._write_plugin("epplugs/a.py", "APlugin", "test-a")
+        self._write(
+            "epplugs_dist-0.1.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: epplugs-dist\nVersion: 0.1\n",
+        )
+        self._write(
+            "epplugs_dist-0.1.dist-info/entry_points.txt",
+            "[pipecat.plugins]\n"
+            "broken = epplugs.a:DoesNotExist\n"
+            "good = epplugs.a:APlugin\n",
+        )
+        importlib.invalidate_caches()
+
+        with self.assertLogs("pipecat.plugins.discovery", level="ERROR"):
+            found = discover_plugins(walk=False)
+
+        assert [cls.__name__ for cls in found] == ["APlugin"]
+
+    def test_imports_needing_the_main_thread(self):
+        self._write("mainplugs/__init__.py")
+        self._write_plugin("mainplugs/a.py", "APlugin", "test-main-a")
+        # signal.signal raises ValueError anywhere but the main thread
+        self._write(
+            "mainplugs/b.py",
+            "import signal\n"
+            "signal.signal(signal.SIGTERM, signal.getsignal(signal.SIGTERM))\n"
+            + PLUGIN_SOURCE.format(cls="BPlugin", name="test-main-b"),
+        )
+        importlib.invalidate_caches()
+
+        found = discover_plugins(["mainplugs"])
+
+        assert [cls.__name__ for cls in found] == ["APlugin", "BPlugin"]
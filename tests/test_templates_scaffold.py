@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import jinja2
+
+from pipecat.templates import create_project, scaffold
+
+
+class TemplateTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.templates_dir = self.root / "project_templates"
+        self.output_dir = self.root / "out"
+        # create_project looks for templates next to the scaffold module
+        self._file = mock.patch.object(scaffold, "__file__", str(self.root / "scaffold.py"))
+        self._file.start()
+
+    def tearDown(self):
+        self._file.stop()
+        self._tmp.cleanup()
+
+    def _write(self, relative_path: str, content: str = ""):
+        path = self.templates_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def _create(self, project_name: str = "My Bot", **kwargs) -> Path:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return create_project("test", str(self.output_dir), project_name, **kwargs)
+
+
+class TestListTemplateFiles(TemplateTestCase):
+    def test_matches_glob(self):
+        self._write("test/a.txt")
+        self._write("test/sub/b.txt")
+        self._write("test/sub/deeper/c.py.j2")
+        (self.templates_dir / "test" / "empty").mkdir()
+        os.symlink(self.templates_dir / "test" / "sub", self.templates_dir / "test" / "link")
+        template_dir = self.templates_dir / "test"
+
+        files = scaffold._list_template_files(template_dir)
+
+        expected = [path for path in template_dir.glob("**/*") if path.is_file()]
+        assert sorted(files) == sorted(expected)
+
+
+class TestFilenameMarkers(TemplateTestCase):
+    def test_markers_are_substituted(self):
+        self._write("test/__project_slug__/__project_slug__.py")
+        self._write("test/__author__-notes.txt")
+        self._write("test/plain_name.txt")
+        self._write("test/__unknown__.txt")
+        self._write("test/__count__.txt")
+
+        project = self._create(author="ada", variables={"count": 3})
+
+        files = sorted(str(p.relative_to(project)) for p in project.rglob("*") if p.is_file())
+        assert files == [
+            "__count__.txt",
+            "__unknown__.txt",
+            "ada-notes.txt",
+            "my_bot/my_bot.py",
+            "plain_name.txt",
+        ]
+
+
+class TestRendering(TemplateTestCase):
+    def test_streamed_output_matches_render(self):
+        source = (
+            "# {{ project_name }} by {{ author }}\n"
+            "{% for i in range(items) %}line {{ i }}: {{ project_slug }}\n{% endfor %}"
+            "café {{ note }}\n"
+        )
+        self._write("test/main.py.j2", source)
+        self._write("test/metadata.json", "{}")
+        variables = {"items": 500, "note": "✓"}
+
+        project = self._create(author="ada", variables=variables)
+
+        expected = jinja2.Environment(keep_trailing_newline=True).from_string(source).render(
+            project_name="My Bot", author="ada", project_slug="my_bot", **variables
+        )
+        assert (project / "main.py").read_bytes() == expected.encode("utf-8")
+        assert not (project / "metadata.json").exists()
+
+    def test_bundled_basic_template(self):
+        self._file.stop()
+        try:
+            with tempfile.TemporaryDirectory() as output_dir:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    project = create_project("basic", output_dir, "demo", author="ada")
+                rendered = (project / "main.py").read_text(encoding="utf-8")
+        finally:
+            self._file.start()
+
+        assert "demo - A Pipecat Application" in rendered
+        assert "Created by: ada" in rendered
+        assert "{{" not in rendered
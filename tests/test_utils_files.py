@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2024-2025 Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pipecat.utils.files import write_atomic
+
+
+class TestWriteAtomic(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.path = self.dir / "out.txt"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_writes_and_replaces(self):
+        write_atomic(self.path, b"first")
+        write_atomic(str(self.path), b"second")
+
+        assert self.path.read_bytes() == b"second"
+        assert os.listdir(self.dir) == ["out.txt"]
+
+    def test_new_file_respects_umask(self):
+        old_umask = os.umask(0o027)
+        try:
+            write_atomic(self.path, b"data")
+        finally:
+            os.umask(old_umask)
+
+        assert self.path.stat().st_mode & 0o777 == 0o640
+
+    def test_keeps_existing_mode(self):
+        self.path.write_bytes(b"old")
+        self.path.chmod(0o600)
+
+        write_atomic(self.path, b"new")
+
+        assert self.path.stat().st_mode & 0o777 == 0o600
+
+    def test_failed_write_leaves_target_and_no_temp_file(self):
+        self.path.write_bytes(b"old")
+
+        with mock.patch("os.replace", side_effect=OSError("boom")):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, b"new")
+
+        assert self.path.read_bytes() == b"old"
+        assert os.listdir(self.dir) == ["out.txt"]
+
+    def test_concurrent_writers(self):
+        payloads = [bytes([65 + i]) * 100_000 for i in range(8)]
+
+        def writer(data):
+            for _ in range(20):
+                write_atomic(self.path, data)
+
+        threads = [threading.Thread(target=writer, args=(data,)) for data in payloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert self.path.read_bytes() in payloads
+        assert os.listdir(self.dir) == ["out.txt"]